@@ -4,20 +4,61 @@
 AeroX class
 """
 
+import os
+import json
+import fnmatch
+import pickle
+import hashlib
+import fractions
+import functools
+import threading
+import collections
+import importlib.util
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.interpolate import RBFInterpolator
-from scipy.interpolate import LinearNDInterpolator
-from scipy.interpolate import NearestNDInterpolator
 
-try:
-    import pint
-    use_pint = True
-except ImportError:
-    use_pint = False
+# matplotlib, scipy and pint are only imported when first needed
+# check pint is available without the cost of importing it
+use_pint = importlib.util.find_spec('pint') is not None
+
+# number of rows formatted and written in one go
+write_block_rows = 65536
+
+# interpolate evaluates query points in blocks of at most this many rows
+# and global RBF also limits each block to about this many bytes of work
+interpolate_block_rows = 65536
+interpolate_block_bytes = 1<<27
+
+# memory in bytes for the tiles of a tiled interpolator, the least recently 
+# used tiles are dropped and rebuilt when needed again
+tile_cache_bytes = 1<<28
+
+# number of threads or processes interpolate uses by default for large queries
+interpolate_workers = 1
+
+# number of fitted interpolators kept by each object, for different methods 
+# or outputs, the least recently used is dropped when there are more
+interpolator_cache_size = 8
+
+# input columns with at least this many rows are filtered using a sorted index
+# set to None to always scan the column
+index_min_rows = 10000
+
+# first bytes of a binary AeroX file, see AeroX.write
+binary_magic = b'AEROXBIN'
+
+# compression level from 1, fastest, to 9, smallest, for writing .gz, .bz2 
+# and .xz files, compressed files being read are recognised by first bytes
+compress_level = 6
+compression_formats = {'gzip': (b'\x1f\x8b', '.gz'), 'bz2': (b'BZh', '.bz2'), 
+                       'lzma': (b'\xfd7zXZ\x00', '.xz')}
 
 class AeroX:
-    def __init__(self, filename=None,  x_nd=0, y_nd=0, nrows=0):
+    # attributes of lazy objects that are only set when the data is read
+    _lazy_attributes = ('x', 'y', '_table', '_id_codes', '_id_names', 
+                        'x_min', 'x_max', 'x_mean', 'y_min', 'y_max', 'y_mean')
+    
+    def __init__(self, filename=None,  x_nd=0, y_nd=0, nrows=0, cache=False, 
+                 lazy=False, dtype=np.float64):
         """
         initialise AeroX instance by reading filename
         splitting out comment section
@@ -25,27 +66,44 @@ class AeroX:
         reading body data into x and y and setting min, max and means
         if no filename is supplied then initialise an empty object of size
         with x_nd inputs, y_nd outputs and nrows
+        if cache is True the parsed data is saved to a binary sidecar file
+        next to filename and reloaded from there while filename is unchanged
+        files compressed with gzip, bz2 or xz are decompressed as they are read
+        if lazy is True only the comments and header are read, the data is 
+        read when first used, and comments after the header added then
+        binary files written by write(binary=True) are recognised and read,
+        columns of a lazy binary object are memory mapped by get
+        dtype is the type of the data, float32 halves the memory needed
+        x and y are views of a single table of inputs then outputs and 
+        id is stored as an integer code for each row and a list of names
         """
 
         self.comments = []
         self.constants = False
-        
-        if use_pint:
-            # set up pint units system
-            self.units = pint.UnitRegistry(system='SI')
-        else:
-            self.units = None
+        self.dtype = np.dtype(dtype)
+        self._index = {} # name to column lookup, see _build_index
+        self._version = 0 # incremented whenever the data changes
+        self._x_versions = [] # version of each input column, see _new_versions
+        self._y_versions = [] # version of each output column
+        self._sorted = {} # sorted input columns, see _sorted_index
+        self._interp_options = None # set by add_interpolator
+        self._interps = collections.OrderedDict() # see _interpolator
+        self._lazy = None # file and body position of lazy object, see __getattr__
+        self._append = None # arrays with spare rows, see append_rows
+        self._id_array = None # codes, names and array returned by id
+        self._binary = None # header of lazy binary file, see _read_binary_header
                           
         if filename is None: # special case create empty object
             self.x_longnames = []
             self.x_units =     []
             self.x_names =     []
-            self.x =  np.array([])
+            self.x =  np.array([], dtype=self.dtype)
      
             self.y_longnames = []
             self.y_units =     []
             self.y_names =     []
-            self.y =  np.array([])
+            self.y =  np.array([], dtype=self.dtype)
+            self._table = None
             
             self.id_name =     []
             self.id = np.array([])
@@ -54,45 +112,341 @@ class AeroX:
             self.y_nd = y_nd
         
             if nrows > 0 : # special case create empty array
-                self.x = np.zeros((nrows,x_nd))
-                self.y = np.zeros((nrows,y_nd))
+                self._set_table(np.zeros((nrows, x_nd + y_nd), dtype=self.dtype))
                                             
             return
             
+        if is_binary(filename):
+            header = self._read_binary_header(filename)
+            if lazy:
+                self._binary = header
+                self._lazy = (filename, None, False)
+                return
+            table, self.id = self._read_binary_body(header)
+            self._set_table(table)
+            self._set_minmaxmean_x()
+            self._set_minmaxmean_y()
+            return
+            
+        # read header only, data is read when first used
+        if lazy:
+            with open_file(filename) as f:
+                self._parse_header(self._read_header(f))
+                self._lazy = (filename, f.tell(), cache)
+            return
+            
+        # use binary sidecar if it is still valid
+        if cache and self._load_cache(filename):
+            return
+
         # Normal case read from file            
         # read file and split into header and body
         body = self._read(filename)
                 
-        # read dimensions of input x and output y in first clean line
-        # since a valid csv may have extra commas just read first two columns
-        x_nd, y_nd = map(int, body[0].split(',')[:2])
+        # first four clean lines are the header
+        self._parse_header(body[:4])
+        x_nd = self.x_nd; y_nd = self.y_nd
+        
+        # extract data in remaining lines in a single pass, 
+        # store as numpy array along with optional identifier
+        table, self.id = extract_body(body, 4, x_nd, y_nd, dtype=self.dtype)
+        self._set_table(table)
        
-        self.constants = (x_nd==0) # special case x_nd zero for constants
- 
-        self.x_nd = x_nd
-        self.y_nd = y_nd
-
-        # extract headers in next 3 lines, store as lists
-        self.x_longnames =  extract_strings(body[1], 0, x_nd)
-        self.x_units =      extract_strings(body[2], 0, x_nd)
-        self.y_longnames =  extract_strings(body[1], x_nd, x_nd+y_nd)
-        self.y_units =      extract_strings(body[2], x_nd, x_nd+y_nd) 
+        # compute min, max and mean of columns of data
+        self._set_minmaxmean_x()
+        self._set_minmaxmean_y()
         
-        self.x_names =      extract_strings(body[3], 0, x_nd)
-        self.y_names =      extract_strings(body[3], x_nd, x_nd+y_nd)
+        if cache:
+            self._save_cache(filename)
+
+    
+    def __getattr__(self, name):
+        """ read the data of an object opened with lazy=True when first used """
+        lazy = self.__dict__.get('_lazy')
+        if lazy is None or name not in self._lazy_attributes:
+            raise AttributeError(f"'AeroX' object has no attribute '{name}'")
+        self._lazy = None
+        self._read_body(*lazy)
+        return getattr(self, name)
+    
+    
+    def _read_body(self, filename, offset, cache=False, comment_char='#'):
+        """ read data from position offset of filename, the start of the body """
+        if self._binary is not None:
+            table, self.id = self._read_binary_body(self._binary)
+            self._binary = None
+            self._set_table(table)
+            self._set_minmaxmean_x()
+            self._set_minmaxmean_y()
+            return
         
-        # extract data in remaining lines, store as numpy array            
-        self.x = extract_array(body, 4, 0,    x_nd)
-        self.y = extract_array(body, 4, x_nd, x_nd+y_nd)
+        if cache and self._load_cache(filename):
+            return
         
-        # deal with optional identifier
-        self.id_name =  extract_strings(body[3], x_nd+y_nd, x_nd+y_nd+1 )
-        self.id =       extract_array(body, 4,   x_nd+y_nd, x_nd+y_nd+1, string=True )
-       
-        # compute min, max and mean of columns of data
+        body = []
+        with open_file(filename) as f:
+            f.seek(offset)
+            for line in f:
+                line = line.strip() # remove white spaces on either end
+                if not line:
+                    continue
+                if line[0]==comment_char:
+                    line = line.rstrip(',') # remove multiple commas from excel
+                    self.comments.append(line)          
+                else:
+                    body.append(line)
+                    
+        table, self.id = extract_body(body, 0, self.x_nd, self.y_nd, dtype=self.dtype)
+        self._set_table(table)
         self._set_minmaxmean_x()
         self._set_minmaxmean_y()
+        
+        if cache:
+            self._save_cache(filename)
+        
+    
+    @property
+    def id(self):
+        """ identifiers as a 2d array with one column of strings, 
+        empty if there are none, stored as codes into a list of names 
+        the array is kept until the identifiers change, values set in it 
+        are stored back into the codes by _sync_id when they are next used """
+        if self._id_codes is None:
+            return np.array([])
+        cache = self._id_array
+        if cache is None or cache[0] is not self._id_codes or cache[1] is not self._id_names:
+            ids = np.array(self._id_names)[self._id_codes].reshape(-1, 1)
+            self._id_array = cache = (self._id_codes, self._id_names, ids)
+        return cache[2]
+    
+    
+    @id.setter
+    def id(self, value):
+        """ set identifiers from an array of strings with one per row, 
+        or a tuple of integer codes and list of names """
+        if isinstance(value, tuple):
+            codes, names = value
+            self._id_codes = np.asarray(codes, dtype=np.int32)
+            self._id_names = list(names)
+        elif np.size(value) == 0:
+            self._id_codes = None
+            self._id_names = []
+        else:
+            names, codes = np.unique(np.asarray(value, dtype=str).ravel(), return_inverse=True)
+            self._id_codes = codes.astype(np.int32)
+            self._id_names = names.tolist()
+            
+            
+    def _sync_id(self):
+        """ 
+        store values set in the array returned by id back into the codes,
+        called before the codes are used, only rows that differ are recoded
+        """
+        cache = self._id_array
+        if cache is None or cache[0] is not self._id_codes or cache[1] is not self._id_names:
+            return
+        ids = cache[2][:, 0]
+        changed = np.flatnonzero(ids != np.array(self._id_names)[self._id_codes])
+        if changed.size == 0:
+            return
+        
+        # new codes and names, the old ones may be shared with append_rows
+        codes = self._id_codes.copy(); names = list(self._id_names)
+        lookup = {name: i for i, name in enumerate(names)}
+        for row in changed:
+            name = str(ids[row])
+            code = lookup.get(name)
+            if code is None:
+                code = lookup[name] = len(names)
+                names.append(name)
+            codes[row] = code
+        self._id_codes = codes; self._id_names = names
+        self._id_array = (codes, names, cache[2])
+            
+            
+    def _set_table(self, table):
+        """ store 2d array of inputs then outputs, x and y are views of it """
+        self._table = table
+        self.x = table[:, :self.x_nd] if self.x_nd > 0 else []
+        self.y = table[:, self.x_nd:]
+        
+        
+    def _xy(self):
+        """ 
+        return 2d array of inputs then outputs, x and y are views of it 
+        unless they have been replaced, then a new one is made from them 
+        """
+        table = self._table
+        if (table is not None and same_view(self.y, table[:, self.x_nd:]) and
+            (self.x_nd == 0 or same_view(self.x, table[:, :self.x_nd]))):
+            return table
+        
+        x = self.x if self.x_nd > 0 and np.ndim(self.x) == 2 else None
+        y = self.y if np.ndim(self.y) == 2 else None
+        if x is not None:
+            nrows = x.shape[0]
+        else:
+            nrows = 0 if y is None else y.shape[0]
+        table = np.empty((nrows, self.x_nd + self.y_nd), dtype=self.dtype)
+        if x is not None:
+            table[:, :self.x_nd] = x
+        if y is not None:
+            table[:, self.x_nd:] = y
+        self._set_table(table)
+        self._x_versions = self._new_versions(self._x_versions, self.x_nd)
+        self._y_versions = self._new_versions(self._y_versions, self.y_nd)
+        return table
+    
+        
+    @property
+    def units(self):
+        """ pint unit registry shared by all instances, None if unavailable """
+        if use_pint:
+            return unit_registry()
+        else:
+            return None
+        
+        
+    @classmethod
+    def iter_chunks(cls, filename, rows=100_000, comment_char='#', dtype=np.float64):
+        """
+        generator to read a large AeroX file in blocks of rows
+        the header is parsed once and each block is yielded as an AeroX 
+        object with the same names and units, so the whole file is never 
+        held in memory
+        running statistics of all rows read so far are attached to each 
+        block as x_running and y_running, these have min, max, mean and count
+        dtype is the numeric type of the blocks
+        """
+        if is_binary(filename):
+            header = cls(filename, lazy=True, dtype=dtype)
+            x_running = RunningStats(); y_running = RunningStats()
+            for start in range(0, header._binary['nrows'], rows):
+                yield header._chunk(None, x_running, y_running, (start, start + rows))
+            return
+        
+        with open_file(filename) as f:
+            # read comments and header lines only
+            header = cls(dtype=dtype)
+            header._parse_header(header._read_header(f, comment_char))
+            x_nd = header.x_nd; y_nd = header.y_nd
+            
+            x_running = RunningStats(); y_running = RunningStats()
+            
+            lines = []
+            for line in f:
+                line = line.strip()
+                if line and line[0] != comment_char:
+                    lines.append(line)
+                    
+                # a short final block is possible at end of file
+                if len(lines) == rows:
+                    yield header._chunk(lines, x_running, y_running)
+                    lines = []
+            
+            if lines:
+                yield header._chunk(lines, x_running, y_running)
+                
 
+    @classmethod
+    def concat(cls, datasets):
+        """
+        create a new AeroX object with the rows of all datasets in order, 
+        which may be AeroX objects or filenames, read as cls
+        all must have the same input and output names, columns are matched 
+        by name and converted to the units of the first dataset
+        comments are merged without repeats and identifiers are kept
+        """
+        datasets = [cls(os.fspath(data)) if isinstance(data, (str, os.PathLike)) else data 
+                    for data in datasets]
+        if not datasets:
+            raise ValueError('no datasets to concatenate')
+        first = datasets[0]
+        nrows = [data.y.shape[0] for data in datasets]
+        total = sum(nrows)
+        
+        result = cls(dtype=first.dtype)
+        result.constants = first.constants
+        result.x_nd = first.x_nd; result.y_nd = first.y_nd
+        result.x_longnames = first.x_longnames.copy()
+        result.x_units = first.x_units.copy()
+        result.x_names = first.x_names.copy()
+        result.y_longnames = first.y_longnames.copy()
+        result.y_units = first.y_units.copy()
+        result.y_names = first.y_names.copy()
+        result.id_name = next((data.id_name.copy() for data in datasets if data.id_name), [])
+        result._build_index()
+        
+        # allocate output once, each dataset is copied into its rows
+        table = np.empty((total, first.x_nd + first.y_nd), dtype=first.dtype)
+        id_codes = np.zeros(total, dtype=np.int32)
+        id_lookup = {'': 0} # names of identifiers to codes
+        
+        start = 0
+        for data, n in zip(datasets, nrows):
+            rows = slice(start, start+n)
+            # columns of the table of data for the columns of result
+            x_order, x_scale, x_offset = column_conversion(first.x_names, first.x_units, 
+                                                           data.x_names, data.x_units)
+            y_order, y_scale, y_offset = column_conversion(first.y_names, first.y_units, 
+                                                           data.y_names, data.y_units)
+            copy_columns(data._xy(), table[rows], x_order + [data.x_nd + i for i in y_order],
+                         np.append(x_scale, y_scale), np.append(x_offset, y_offset))
+            data._sync_id()
+            if data._id_codes is not None:
+                recode = np.array([id_lookup.setdefault(name, len(id_lookup)) 
+                                   for name in data._id_names], dtype=np.int32)
+                id_codes[rows] = recode[data._id_codes]
+            for comment in data.comments:
+                if comment not in result.comments:
+                    result.comments.append(comment)
+            start = start + n
+        result._set_table(table)
+        result.id = (id_codes, list(id_lookup))
+        
+        # compute min, max and mean of columns of data
+        result._set_minmaxmean_x()
+        result._set_minmaxmean_y()
+        return result
+    
+    
+    def _chunk(self, lines, x_running, y_running, rows=None):
+        """ 
+        convenience function for iter_chunks, create a new AeroX object 
+        with the header of this one and data from lines, or from rows
+        (start, stop) of a binary file if lines is None,
+        also updates running statistics 
+        """
+        chunk = AeroX(dtype=self.dtype)
+        chunk.comments = self.comments.copy()
+        chunk.constants = self.constants
+        chunk.x_nd = self.x_nd; chunk.y_nd = self.y_nd
+        chunk.x_longnames = self.x_longnames.copy()
+        chunk.x_units = self.x_units.copy()
+        chunk.x_names = self.x_names.copy()
+        chunk.y_longnames = self.y_longnames.copy()
+        chunk.y_units = self.y_units.copy()
+        chunk.y_names = self.y_names.copy()
+        chunk.id_name = self.id_name.copy()
+        chunk._build_index()
+        
+        if lines is None:
+            table, chunk.id = self._read_binary_body(self._binary, *rows)
+        else:
+            table, chunk.id = extract_body(lines, 0, self.x_nd, self.y_nd, dtype=self.dtype)
+        chunk._set_table(table)
+        chunk._set_minmaxmean_x()
+        chunk._set_minmaxmean_y()
+        
+        # running statistics, each block stores its own snapshot
+        if self.x_nd > 0:
+            x_running.update(chunk.x)
+        y_running.update(chunk.y)
+        chunk.x_running = x_running.copy()
+        chunk.y_running = y_running.copy()
+        
+        return chunk
+    
     
     def import_simpleCSV(self, filename, x_nd, y_nd,
                          delimiter_char=',', quote_char='"', comment_char='#',
@@ -124,18 +478,15 @@ class AeroX:
                                        delimiter_char=delimiter_char, quote_char=quote_char)
         self.y_names = extract_strings(body[data_line-1], x_nd, x_nd+y_nd,
                                        delimiter_char=delimiter_char, quote_char=quote_char)
+        self._build_index()
         
-        # extract data in remaining lines, store as numpy array            
-        self.x = extract_array(body, data_line, 0,    x_nd, 
-                               delimiter_char=delimiter_char)
-        self.y = extract_array(body, data_line, x_nd, x_nd+y_nd, 
-                               delimiter_char=delimiter_char)
-
-        # deal with optional identifier
+        # extract data in remaining lines in a single pass, 
+        # store as numpy array along with optional identifier
+        table, self.id = extract_body(body, data_line, x_nd, y_nd,
+                                      delimiter_char=delimiter_char, dtype=self.dtype)
+        self._set_table(table)
         self.id_name =  extract_strings(body[data_line-1], x_nd+y_nd, x_nd+y_nd+1,
                                         delimiter_char=delimiter_char, quote_char=quote_char)
-        self.id =       extract_array(body, data_line,   x_nd+y_nd, x_nd+y_nd+1, 
-                                      delimiter_char=delimiter_char, string=True )
        
         # compute min, max and mean of columns of data
         self._set_minmaxmean_x()
@@ -143,18 +494,203 @@ class AeroX:
 
     
     def write(self, filename, simple_CSV=False, JSON=False, 
-              delimiter_char=',', quote_char='"', comment_char='#', sig_figs=6):
+              delimiter_char=',', quote_char='"', comment_char='#', sig_figs=6,
+              binary=False, compresslevel=None):
         """
         writes AeroX file
         has the option of a standard format CSV (one header line)
         and the option of a JSON file to describe the data
         default delimiter, quote and comment characters can be over-ridden
         default writes data up to 6 significant figures
+        binary writes every value exactly in a binary file, read back by AeroX,
+        where each column can be memory mapped
+        filenames ending .gz, .bz2 or .xz are compressed as they are written
+        with compresslevel from 1 to 9, default compress_level
         """
+        if binary:
+            self._write_binary(filename)
+            return
 
-        f = open(filename,'w')
+        f = open_file(filename, 'w', compresslevel)
         delimiter_char = delimiter_char + ' ' # adds extra space when writing
-                
+        
+        self._write_header(f, simple_CSV, delimiter_char)
+        for text in self._format_blocks(0, sig_figs, delimiter_char):
+            f.write(text)
+               
+        f.close()
+        
+        return
+    
+    
+    def write_append(self, filename, start=0, delimiter_char=',', sig_figs=6,
+                     compresslevel=None):
+        """
+        appends rows from start onwards to the end of an existing AeroX file
+        which must have the same names, units and identifier name, or writes a new file 
+        with these rows if filename does not exist 
+        each block of rows is written with a single system call and the 
+        file is flushed to disk at the end, so readers see whole blocks, 
+        except while a block is being written 
+        compressed files have each block added as a separate compressed 
+        stream, which readers join, and must end with a new line as files 
+        written by AeroX do
+        returns the number of rows written
+        """
+        nrows = self.y.shape[0] - start
+        if nrows < 0 or start < 0:
+            raise ValueError(f'start row {start} is not within {self.y.shape[0]} rows')
+        delimiter_char = delimiter_char + ' ' # adds extra space when writing
+        
+        kind = compression(filename, 'a')
+        if not os.path.exists(filename) and kind is None:
+            with open(filename, 'w') as f:
+                self._write_header(f, False, delimiter_char)
+                for text in self._format_blocks(start, sig_figs, delimiter_char):
+                    f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            return nrows
+        
+        if not os.path.exists(filename):
+            # header is a compressed stream of its own, rows are added below
+            with open_file(filename, 'w', compresslevel) as f:
+                self._write_header(f, False, delimiter_char)
+        else:
+            # check header of existing file
+            if is_binary(filename):
+                raise ValueError(f'unable to append text rows to binary file {filename}')
+            existing = AeroX(filename, lazy=True)
+            for attribute in ['x_names', 'y_names', 'x_units', 'y_units', 'id_name']:
+                if getattr(existing, attribute) != getattr(self, attribute):
+                    raise ValueError(f'{attribute} {getattr(self, attribute)} do not match '
+                                     f'{getattr(existing, attribute)} of {filename}')
+        
+        fd = os.open(filename, os.O_RDWR | os.O_APPEND)
+        try:
+            # complete last line if it has no newline
+            if kind is None and os.lseek(fd, 0, os.SEEK_END) > 0:
+                os.lseek(fd, -1, os.SEEK_END)
+                if os.read(fd, 1) != b'\n':
+                    write_all(fd, os.linesep.encode())
+                    
+            for text in self._format_blocks(start, sig_figs, delimiter_char):
+                text = text.replace('\n', os.linesep).encode()
+                if kind is not None:
+                    text = compress_bytes(kind, text, compresslevel)
+                write_all(fd, text)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        return nrows
+    
+    
+    def _write_binary(self, filename):
+        """
+        writes binary AeroX file, the magic bytes, length of a JSON header 
+        with the comments, names and units and the offset of each column 
+        then each column as a little endian array, followed by id codes
+        columns start on 64 byte boundaries so they can be memory mapped
+        """
+        if compression(filename, 'w') is not None:
+            raise ValueError(f'binary file {filename} can not be compressed, '
+                             'columns would not be memory mapped')
+        self._sync_id()
+        table = self._xy()
+        nrows = table.shape[0]
+        dtype = self.dtype.newbyteorder('<')
+        
+        # offsets are from the start of the data, after the header
+        columns = []; end = 0
+        for _ in range(table.shape[1]):
+            columns.append(end)
+            end = align_offset(end + nrows*dtype.itemsize)
+        if self._id_codes is not None:
+            id_offset = end; id_names = self._id_names
+            end = end + 4*nrows
+        else:
+            id_offset = None; id_names = []
+        
+        header = {'version': 1, 'comments': self.comments, 
+                  'x_nd': self.x_nd, 'y_nd': self.y_nd,
+                  'x_longnames': self.x_longnames, 'x_units': self.x_units, 
+                  'x_names': self.x_names,
+                  'y_longnames': self.y_longnames, 'y_units': self.y_units, 
+                  'y_names': self.y_names, 'id_name': self.id_name,
+                  'nrows': nrows, 'dtype': dtype.str, 'columns': columns, 
+                  'id_offset': id_offset, 'id_names': id_names}
+        text = json.dumps(header).encode()
+        start = align_offset(len(binary_magic) + 8 + len(text))
+        
+        with open(filename, 'wb') as f:
+            f.write(binary_magic)
+            f.write(len(text).to_bytes(8, 'little'))
+            f.write(text)
+            for col, column_offset in enumerate(columns):
+                f.seek(start + column_offset)
+                for row in range(0, nrows, write_block_rows):
+                    block = table[row:row + write_block_rows, col]
+                    f.write(block.astype(dtype).tobytes())
+            if id_offset is not None:
+                f.seek(start + id_offset)
+                f.write(self._id_codes.astype('<i4').tobytes())
+            # file must reach the end of the last column even if it is empty
+            f.truncate(start + end)
+    
+    
+    def _read_binary_header(self, filename):
+        """
+        reads the header of binary AeroX filename, sets the comments, 
+        names and units and returns the header with the position of 
+        the start of the data added
+        """
+        with open(filename, 'rb') as f:
+            if f.read(len(binary_magic)) != binary_magic:
+                raise ValueError(f'{filename} is not a binary AeroX file')
+            length = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(length).decode())
+        if header['version'] != 1:
+            raise ValueError(f"binary AeroX version {header['version']} of {filename} "
+                             'is not supported')
+        header['filename'] = filename
+        header['start'] = align_offset(len(binary_magic) + 8 + length)
+        
+        x_nd = header['x_nd']
+        self.comments = header['comments']
+        self.constants = (x_nd==0) # special case x_nd zero for constants
+        self.x_nd = x_nd
+        self.y_nd = header['y_nd']
+        for key in ['x_longnames', 'x_units', 'x_names', 
+                    'y_longnames', 'y_units', 'y_names', 'id_name']:
+            setattr(self, key, header[key])
+        self._build_index()
+        return header
+    
+    
+    def _read_binary_body(self, header, start=0, stop=None):
+        """
+        read rows start to stop of a binary AeroX file with header
+        returns table and id as (codes, names), only these rows are read
+        """
+        nrows = header['nrows']
+        filename = header['filename']
+        rows = range(nrows)[start:stop]
+        
+        table = np.empty((len(rows), len(header['columns'])), dtype=self.dtype)
+        for col, offset in enumerate(header['columns']):
+            column = binary_column(filename, header['start'] + offset, header['dtype'], nrows)
+            table[:, col] = column[start:stop]
+        
+        if header['id_offset'] is None:
+            id = np.array([])
+        else:
+            codes = binary_column(filename, header['start'] + header['id_offset'], '<i4', nrows)
+            id = (np.array(codes[start:stop], dtype=np.int32), header['id_names'])
+        return table, id
+    
+    
+    def _write_header(self, f, simple_CSV=False, delimiter_char=', '):
+        """ writes comments and header lines to open file f """
         if not simple_CSV: # default is normal AeroX file
             for comment in self.comments:
                 f.write(comment+'\n')
@@ -165,25 +701,31 @@ class AeroX:
 
         f.write(delimiter_char.join(self.x_names + self.y_names + self.id_name)+'\n')   
         
-        if self.constants:
-            xy = self.y
+        
+    def _format_blocks(self, start=0, sig_figs=6, delimiter_char=', '):
+        """
+        generator of text of rows from start onwards, formatted in large 
+        blocks of rows at a time, each line ends with a newline
+        """
+        xy = self._xy()[start:]
+        self._sync_id()
+        
+        if self._id_codes is not None : # if id is not empty
+            ids = np.array(self._id_names, dtype=object)[self._id_codes[start:]].tolist()
         else:
-            xy = np.column_stack((self.x, self.y))
-                   
-        for i,row in enumerate(xy):
-            line = delimiter_char.join([format_number(num,sig_figs) 
-                                        for num in xy[i]])
- 
-            if self.id.size > 0 : # if id is not empty
-                if self.id[i]: # add to line if we find some text
-                    line += delimiter_char + str(self.id[i,0])
-            
-            line += '\n'
-            f.write(line)
-               
-        f.close()
+            ids = None
         
-        return
+        for block in range(0, xy.shape[0], write_block_rows):
+            lines = format_rows(xy[block:block+write_block_rows], sig_figs, 
+                                delimiter_char)
+            
+            if ids is not None:
+                block_ids = ids[block:block+write_block_rows]
+                # add to line if we find some text
+                lines = [line + delimiter_char + str(id) if id else line
+                         for line, id in zip(lines, block_ids)]
+            
+            yield '\n'.join(lines) + '\n'
     
        
     def _read(self, filename, comment_char='#'):
@@ -191,163 +733,561 @@ class AeroX:
          reads AeroX file and splits into comments and body
          the body text is returned and comments stored
          """
-         with open(filename, 'r') as f:
-             lines = f.readlines()
-             
          self.comments = []; body = []
-         for line in lines:
-             line = line.strip() # remove white spaces on either end
-             if line[0]==comment_char:
-                 line = line.rstrip(',') # remove multiple commas from excel
-                 self.comments.append(line)          
-             else:
- #                body.append(line+',') # fudge to allow reading extra column as a tag
-                 body.append(line)
+         with open_file(filename) as f:
+             # iterate over file rather than readlines to avoid a second copy
+             for line in f:
+                 line = line.strip() # remove white spaces on either end
+                 if not line: # blank lines are skipped as by _read_body
+                     continue
+                 if line[0]==comment_char:
+                     line = line.rstrip(',') # remove multiple commas from excel
+                     self.comments.append(line)          
+                 else:
+ #                    body.append(line+',') # fudge to allow reading extra column as a tag
+                     body.append(line)
          # return body but store comments in instance        
          return body 
-     
+
+
+    def _read_header(self, f, comment_char='#'):
+        """
+        reads lines from open file f up to the end of the AeroX header
+        comments are stored and the four header lines returned,
+        leaves f positioned at the start of the body
+        """
+        self.comments = []; header = []
+        while len(header) < 4:
+            line = f.readline()
+            if not line: # end of file before complete header
+                raise ValueError('incomplete AeroX header')
+            line = line.strip() # remove white spaces on either end
+            if not line:
+                continue
+            if line[0]==comment_char:
+                line = line.rstrip(',') # remove multiple commas from excel
+                self.comments.append(line)          
+            else:
+                header.append(line)
+        return header
+
+
+    def _parse_header(self, header):
+        """
+        set dimensions, long names, units and names from the four header lines
+        """
+        # read dimensions of input x and output y in first clean line
+        # since a valid csv may have extra commas just read first two columns
+        x_nd, y_nd = map(int, header[0].split(',')[:2])
+        
+        self.constants = (x_nd==0) # special case x_nd zero for constants
+  
+        self.x_nd = x_nd
+        self.y_nd = y_nd
+ 
+        # extract headers in next 3 lines, store as lists
+        self.x_longnames =  extract_strings(header[1], 0, x_nd)
+        self.x_units =      extract_strings(header[2], 0, x_nd)
+        self.y_longnames =  extract_strings(header[1], x_nd, x_nd+y_nd)
+        self.y_units =      extract_strings(header[2], x_nd, x_nd+y_nd) 
+        
+        self.x_names =      extract_strings(header[3], 0, x_nd)
+        self.y_names =      extract_strings(header[3], x_nd, x_nd+y_nd)
+        self.id_name =      extract_strings(header[3], x_nd+y_nd, x_nd+y_nd+1 )
+        self._build_index()
+
+
+    def _save_cache(self, filename):
+        """
+        save parsed arrays and header to a binary sidecar of filename
+        keyed on the size, modification time and content hash of filename
+        """
+        self._sync_id()
+        stat = os.stat(filename)
+        meta = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                'hash': file_hash(filename),
+                'comments': self.comments, 'x_nd': self.x_nd, 'y_nd': self.y_nd,
+                'x_longnames': self.x_longnames, 'x_units': self.x_units, 
+                'x_names': self.x_names,
+                'y_longnames': self.y_longnames, 'y_units': self.y_units, 
+                'y_names': self.y_names, 'id_name': self.id_name,
+                'dtype': self.dtype.str, 'id': self._id_codes is not None}
+        
+        if self._id_codes is None:
+            id_codes = np.zeros(0, dtype=np.int32); id_names = np.array([], dtype=str)
+        else:
+            id_codes = self._id_codes; id_names = np.array(self._id_names, dtype=str)
+        write_cache(cache_filename(filename), meta, self._xy(), id_codes, id_names)
+            
+
+    def _load_cache(self, filename):
+        """
+        load arrays and header from the binary sidecar of filename
+        returns False if there is no cache or it is stale or corrupt, or 
+        it is stored with less precision than the dtype of this object,
+        then the file is parsed again and the cache saved at this precision
+        """
+        cachename = cache_filename(filename)
+        if not os.path.exists(cachename):
+            return False
+        
+        try:
+            with np.load(cachename, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                
+                # compare with source, only hash if the modification time differs
+                stat = os.stat(filename)
+                if meta['size'] != stat.st_size:
+                    return False
+                touched = meta['mtime_ns'] != stat.st_mtime_ns
+                if touched and meta['hash'] != file_hash(filename):
+                    return False
+                
+                if 'table' not in data.files: # written by an older version
+                    return False
+                if np.dtype(meta['dtype']).itemsize < self.dtype.itemsize:
+                    return False
+                table = data['table']
+                id_codes = data['id_codes']; id_names = data['id_names']
+                
+        except Exception as error: # any failure means rebuild the cache
+            print(f'Warning: ignoring corrupt cache {cachename}, {error}')
+            return False
+        
+        x_nd = meta['x_nd']; y_nd = meta['y_nd']
+        if (table.ndim != 2 or table.shape[1] != x_nd + y_nd or 
+            (meta['id'] and id_codes.shape != (table.shape[0],))):
+            print(f'Warning: ignoring corrupt cache {cachename}')
+            return False
+        
+        self.comments = meta['comments']
+        self.constants = (x_nd==0) # special case x_nd zero for constants
+        self.x_nd = x_nd
+        self.y_nd = y_nd
+        for key in ['x_longnames', 'x_units', 'x_names', 
+                    'y_longnames', 'y_units', 'y_names', 'id_name']:
+            setattr(self, key, meta[key])
+        self._build_index()
+        
+        self._set_table(table.astype(self.dtype, copy=False))
+        self.id = (id_codes, id_names.tolist()) if meta['id'] else np.array([])
+        
+        # same content with a new modification time, so later opens 
+        # only need to compare the modification time again
+        if touched:
+            meta['mtime_ns'] = stat.st_mtime_ns
+            write_cache(cachename, meta, table, id_codes, id_names)
+        
+        # compute min, max and mean of columns of data
+        self._set_minmaxmean_x()
+        self._set_minmaxmean_y()
+        return True
+
+
+    def append_rows(self, x, y, id=None):
+        """
+        append rows of inputs x and outputs y, with optional identifiers,
+        a single row can be given as a list of values
+        the table has spare rows, doubling when full, so appending a row 
+        at a time is cheap and min, max and mean are updated from the new 
+        rows only
+        """
+        y = np.asarray(y, dtype=self.dtype).reshape(-1, self.y_nd)
+        n = y.shape[0]
+        if self.x_nd > 0:
+            x = np.asarray(x, dtype=self.dtype).reshape(-1, self.x_nd)
+            if x.shape[0] != n:
+                raise ValueError(f'{x.shape[0]} rows of x and {n} rows of y')
+        ids = [''] * n if id is None else np.asarray(id, dtype=str).reshape(n).tolist()
+        
+        state = self._append_buffers(n)
+        rows = slice(state['rows'], state['rows'] + n)
+        state['rows'] = state['rows'] + n
+        
+        table = state['table']
+        if self.x_nd > 0:
+            table[rows, :self.x_nd] = x
+            state['x_stats'].update(x)
+            self.x_min = state['x_stats'].min
+            self.x_max = state['x_stats'].max
+            self.x_mean = state['x_stats'].mean
+        table[rows, self.x_nd:] = y
+        state['y_stats'].update(y)
+        self.y_min = state['y_stats'].min
+        self.y_max = state['y_stats'].max
+        self.y_mean = state['y_stats'].mean
+        self._set_table(table[:state['rows']])
+        
+        # new identifiers are added to the list of names
+        names = state['id_names']; lookup = state['id_lookup']
+        for i, name in enumerate(ids):
+            code = lookup.get(name)
+            if code is None:
+                code = lookup[name] = len(names)
+                names.append(name)
+            ids[i] = code
+        state['id_codes'][rows] = ids
+        self._id_codes = state['id_codes'][:state['rows']]
+        self._id_names = names
+        state['ids'] = self._id_codes
+        
+        # mark the data as changed, new rows change every column
+        self._x_versions = self._new_versions(self._x_versions, self.x_nd)
+        self._y_versions = self._new_versions(self._y_versions, self.y_nd)
+        state['version'] = self._version
+        
+        
+    def _append_buffers(self, n):
+        """
+        return table and identifier codes for append_rows with space for 
+        n more rows, made from the current data if it changed since the 
+        last append, including x, y or id being replaced
+        """
+        table = self._xy() # new version if x or y was replaced
+        self._sync_id()
+        state = self._append
+        if (state is None or state['version'] != self._version or 
+            state['ids'] is not self._id_codes):
+            state = {'version': self._version, 'rows': table.shape[0], 'table': table,
+                     'ids': self._id_codes,
+                     'x_stats': RunningStats(), 'y_stats': RunningStats()}
+            # objects created empty have no identifiers
+            if self._id_codes is None:
+                state['id_codes'] = np.zeros(table.shape[0], dtype=np.int32)
+                state['id_names'] = ['']
+            else:
+                state['id_codes'] = self._id_codes
+                state['id_names'] = list(self._id_names)
+            state['id_lookup'] = {name: i for i, name in enumerate(state['id_names'])}
+            if self.x_nd > 0:
+                state['x_stats'].update(table[:, :self.x_nd])
+            state['y_stats'].update(table[:, self.x_nd:])
+            state['capacity'] = -1 # arrays must be copied as they may be shared
+            self._append = state
+        
+        rows = state['rows']
+        if rows + n > state['capacity']:
+            capacity = max(16, 2*(rows + n))
+            state['table'] = resize_rows(state['table'], rows, capacity)
+            state['id_codes'] = resize_rows(state['id_codes'], rows, capacity)
+            state['capacity'] = capacity
+        return state
     
-    def _set_minmaxmean_x(self):
+
+    def _new_versions(self, versions, nd, cols=None):
+        """
+        return versions of nd columns with new versions for the list of 
+        changed columns cols, all columns if None
+        every change gets a new number so cached results such as fitted 
+        interpolators can be kept for the columns that didn't change
+        """
+        self._version = self._version + 1
+        if cols is None or len(versions) != nd:
+            versions = [None]*nd
+            cols = range(nd)
+        versions = list(versions)
+        for col in cols:
+            self._version = self._version + 1
+            versions[col] = self._version
+        return versions
+        
+
+    def _set_minmaxmean_x(self, cols=None):
         """
         compute min, max and mean of columns of x 
+        also marks columns cols as changed, all columns if None
+        only columns cols are computed if the others are known
         """
-        if self.x_nd>0:
+        self._x_versions = self._new_versions(self._x_versions, self.x_nd, cols)
+        known = getattr(self, 'x_min', None)
+        if cols is not None and known is not None and np.size(known) == self.x_nd:
+            self.x_min, self.x_max, self.x_mean = update_column_stats(
+                self.x, cols, self.x_min, self.x_max, self.x_mean)
+        elif self.x_nd>0:
             self.x_min =  np.min(self.x, axis=0)
             self.x_max =  np.max(self.x, axis=0)
-            self.x_mean = np.mean(self.x, axis=0)
+            self.x_mean = np.mean(self.x, axis=0, dtype=np.float64)
          
       
-    def _set_minmaxmean_y(self):
+    def _set_minmaxmean_y(self, cols=None):
         """
         compute min, max and mean of columns of y
+        also marks columns cols as changed, all columns if None
+        only columns cols are computed if the others are known
         """       
+        self._y_versions = self._new_versions(self._y_versions, self.y_nd, cols)
+        known = getattr(self, 'y_min', None)
+        if cols is not None and known is not None and np.size(known) == self.y_nd:
+            self.y_min, self.y_max, self.y_mean = update_column_stats(
+                self.y, cols, self.y_min, self.y_max, self.y_mean)
+            return
         self.y_min =  np.min(self.y, axis=0)
         self.y_max =  np.max(self.y, axis=0)
-        self.y_mean = np.mean(self.y, axis=0)
+        self.y_mean = np.mean(self.y, axis=0, dtype=np.float64)
          
       
-    def filter_keep(self, **kwargs):
+    def filter_keep(self, query=None, **kwargs):
         """
         filter rows based on values of x or y
         keep rows that match keyword and value
         can be any number of keyword= value and a logical and is used to combine
+        optionally a Query for ranges, lists of values and combinations
         """
 
-        mask = self._set_mask(**kwargs)
+        mask = self._set_mask(query, **kwargs)
+        self._sync_id()
                        
-        # mask out array (not sure if view or copy)
-        self.x =  self.x[mask]
-        self.y =  self.y[mask]
-        self.id = self.id[mask]
+        # mask out table of x and y once
+        self._set_table(self._xy()[mask])
+        if self._id_codes is not None: # objects created empty have no identifiers
+            self._id_codes = self._id_codes[mask]
         
         # reset min, max and means
         self._set_minmaxmean_x()
         self._set_minmaxmean_y()
 
 
-    def filter_remove(self, **kwargs):
+    def filter_remove(self, query=None, **kwargs):
        """
        filter rows based on values of x or y
        remove rows that match keyword and value
        can be any number of keyword= value and a logical and is used to combine
+       optionally a Query for ranges, lists of values and combinations
        """
        
-       mask = self._set_mask(**kwargs)
+       mask = self._set_mask(query, **kwargs)
+       self._sync_id()
        
        # mask out inverse of array array (not sure if view or copy)
-       self.x =  self.x[np.logical_not(mask)]
-       self.y =  self.y[np.logical_not(mask)]
-       self.id = self.id[np.logical_not(mask)]
+       self._set_table(self._xy()[np.logical_not(mask)])
+       if self._id_codes is not None: # objects created empty have no identifiers
+           self._id_codes = self._id_codes[np.logical_not(mask)]
 
        # reset min, max and means
        self._set_minmaxmean_x()
        self._set_minmaxmean_y()
 
 
-    def _set_mask(self, **kwargs):
-       """ convenience function to set mask based on input values """
-       # initialise True mask of length matching number of rows
-       mask = np.full(self.x.shape[0], True)
+    def _set_mask(self, query=None, **kwargs):
+       """ 
+       convenience function to set mask based on input values 
+       keyword arguments are combined with the optional Query
+       """
+       combined = Query(**kwargs)
+       if query is not None:
+           combined = query & combined
+       return combined.mask(self)
+
+
+    def _find_rows(self, conditions):
+       """ 
+       convenience function to find indices of rows matching all conditions,
+       a list of name, value, rtol and atol as stored by Query
+       use sorted index of a large input column to find candidate rows, 
+       remaining conditions are only tested on the candidates
+       """
+       rows = None # None until first condition, then indices of matching rows
        
-       # go through keyword arguments and build up mask
+       # go through conditions, indexed inputs first
        # test against x names followed by y names
-       # handle case of NaN
-       for keyword, value in kwargs.items():
-           try:
-               # find column index of input for keyword argument
-               xcol = self.x_names.index(keyword)
-               if np.isnan(value):
-                   mask = np.logical_and(mask, np.isnan(self.x[:,xcol]))
-               else:
-                   mask = np.logical_and(mask, np.isclose(self.x[:,xcol],value))
-           except:
-               # find column index of output for keyword argument
-               ycol = self.y_names.index(keyword)
-               if np.isnan(value):
-                   mask = np.logical_and(mask, np.isnan(self.y[:,ycol]))
-               else:
-                   mask = np.logical_and(mask, np.isclose(self.y[:,ycol],value))
-              
+       conditions = sorted(conditions, key=lambda condition: not self._use_index(condition[0]))
+       for name, value, rtol, atol in conditions:
+           if rows is None and self._use_index(name):
+               rows = self._rows_matching(self.get_x_index(name), value, rtol, atol)
+               continue
            
-       return mask
+           # find column of input or output for condition
+           column = self.get(name)
+           if rows is not None:
+               column = column[rows]
+           keep = match_values(column, value, rtol, atol)
+           rows = np.flatnonzero(keep) if rows is None else rows[keep]
+       
+       if rows is None: # no conditions, all rows match
+           return np.arange(self.x.shape[0])
+       return np.sort(rows)
+
+
+    def _use_index(self, name):
+       """ true if name is an input with enough rows for a sorted index """
+       return (index_min_rows is not None and self.x.shape[0] >= index_min_rows 
+               and self._lookup(name)[0] == 'x')
+
+
+    def _sorted_index(self, col):
+       """
+       return the sorting order and the sorted values of input column col
+       built on first use and rebuilt when the column has changed
+       NaN values are sorted to the end
+       """
+       self._xy() # new versions if x was replaced
+       version = self._x_versions[col]
+       entry = self._sorted.get(col)
+       if entry is None or entry[0] != version:
+           # free memory of columns that have changed
+           self._sorted = {c: e for c, e in self._sorted.items() 
+                           if c < self.x_nd and e[0] == self._x_versions[c]}
+           order = np.argsort(self.x[:,col], kind='stable')
+           entry = (version, order, self.x[order,col])
+           self._sorted[col] = entry
+       return entry[1], entry[2]
+
+
+    def _rows_matching(self, col, value, rtol=1.0e-5, atol=1.0e-8):
+       """
+       return indices of rows where input column col matches a condition
+       value, range or list of values as for match_values, using binary search
+       """
+       if isinstance(value, tuple):
+           lower, upper = range_bounds(value)
+           return self._rows_between(col, lower, upper)
+       
+       if isinstance(value, (list, set, frozenset, np.ndarray)):
+           rows = [self._rows_close(col, member, rtol, atol) 
+                   for member in np.unique(np.asarray(list(value), dtype=float))]
+           return np.unique(np.concatenate(rows)) if rows else np.array([], dtype=int)
+       
+       return self._rows_close(col, value, rtol, atol)
+
+
+    def _rows_close(self, col, value, rtol=1.0e-5, atol=1.0e-8):
+       """
+       return indices of rows where input column col matches value 
+       with the same tolerance as np.isclose using binary search
+       """
+       order, values = self._sorted_index(col)
+       
+       if np.isnan(value):
+           start = np.searchsorted(values, np.nan, side='left')
+           return order[start:]
+       if np.isinf(value):
+           return order[values == value]
+       
+       # widen search window so rounding can't lose matches, then check exactly
+       tol = 2.0*(atol + rtol*abs(value))
+       start = np.searchsorted(values, value - tol, side='left')
+       end = np.searchsorted(values, value + tol, side='right')
+       keep = np.isclose(values[start:end], value, rtol=rtol, atol=atol)
+       return order[start:end][keep]
+
+
+    def _rows_between(self, col, lower, upper):
+       """
+       return indices of rows where input column col is between lower and upper
+       inclusive using binary search
+       """
+       order, values = self._sorted_index(col)
+       start = np.searchsorted(values, lower, side='left')
+       end = np.searchsorted(values, upper, side='right')
+       return order[start:end]
 
         
     def get_constant(self, name):
        """ special case return value of constant with name"""
        if self.constants:
            # find column index of output for required name
-           ycol = self.y_names.index(name)
+           ycol = self.get_y_index(name)
            return self.y[0,ycol]
        else:
            return 0.0 # really need to throw an exception
 
 
+    def _build_index(self):
+        """
+        build the mapping of column name to side 'x' or 'y' and column index
+        inputs take precedence over outputs, and first over later duplicates
+        """
+        self._index = {}
+        for col, name in enumerate(self.x_names):
+            self._index.setdefault(name, ('x', col))
+        for col, name in enumerate(self.y_names):
+            self._index.setdefault(name, ('y', col))
+
+
+    def _lookup(self, name):
+        """
+        return side 'x' or 'y' and column index of name
+        the index is rebuilt if the names have been changed directly
+        """
+        found = self._index.get(name)
+        if found is not None:
+            side, col = found
+            names = self.x_names if side == 'x' else self.y_names
+            if col < len(names) and names[col] == name:
+                return found
+            
+        self._build_index()
+        found = self._index.get(name)
+        if found is None:
+            raise ValueError(f"'{name}' is not an input or output name")
+        return found
+
+
     def get(self, name):
         """ return a column with name trying inputs followed by outputs """              
-        try: # look for name in x
-            col = self.x_names.index(name)
-            return self.x[:,col]
- 
-        except: # then look for name in y
-            col = self.y_names.index(name)
-            return self.y[:,col]
+        side, col = self._lookup(name)
+        return self._column(side, col)
 
 
     def get_x(self, name):
         """ return a column of input x with name """              
         # look for name in x only
-        col = self.x_names.index(name)
-        return self.x[:,col]
+        col = self.get_x_index(name)
+        return self._column('x', col)
 
 
     def get_y(self, name):              
         """ return a column of output y with name """              
         # look for name in y only
-        col = self.y_names.index(name)
-        return self.y[:,col]
+        col = self.get_y_index(name)
+        return self._column('y', col)
+
+
+    def _column(self, side, col):
+        """ 
+        return column col of x or y, the data of a lazy binary object that
+        has not been read is memory mapped so only this column is read
+        """
+        if self._binary is not None:
+            header = self._binary
+            if side == 'y':
+                col = self.x_nd + col
+            column = binary_column(header['filename'], header['start'] + header['columns'][col],
+                                   header['dtype'], header['nrows'])
+            return column.astype(self.dtype, copy=False)
+        if side == 'x':
+            return self.x[:,col]
+        else:
+            return self.y[:,col]
 
 
     def get_x_index(self, name):              
         """ return the column index of input x with name """              
         # look for name in x only
-        return self.x_names.index(name)
+        side, col = self._lookup(name)
+        if side != 'x':
+            raise ValueError(f"'{name}' is not an input name")
+        return col
 
 
     def get_y_index(self, name):              
         """ return the column index of output y with name """              
-        return self.y_names.index(name)
+        side, col = self._lookup(name)
+        if side != 'y':
+            # name is also an input, rare so search outputs directly
+            return self.y_names.index(name)
+        return col
 
 
     def replace(self, name, column ):
         """ replace column with name """
-        try: # look for name in x
-            col = self.x_names.index(name)
+        side, col = self._lookup(name)
+        if side == 'x':
             self.x[:,col] = column
-            self._set_minmaxmean_x()
-        except: # then look for name in x
-            col = self.y_names.index(name)
+            self._set_minmaxmean_x([col])
+        else:
             self.y[:,col] = column
-            self._set_minmaxmean_y()
+            self._set_minmaxmean_y([col])
         return
 
 
@@ -355,25 +1295,31 @@ class AeroX:
         """ add a new column of output, default at end 
         optionally before or after a named column """
         
-        if self.x.size == 0: 
+        table = self._xy()
+        if table.shape[1] == 0: 
             # case for empty need to set the number of rows to append axis=1
-            self.x = np.empty((column.size,0))
+            table = np.empty((column.size,0), dtype=self.dtype)
+            col_idx = 0
+        elif self.x_nd == 0:
             col_idx = 0
         elif before is not None:
-            col_idx = self.x_names.index(before)
+            col_idx = self.get_x_index(before)
         elif after is not None:
-            col_idx = self.x_names.index(after) + 1
+            col_idx = self.get_x_index(after) + 1
         else:
-            col_idx = self.x.shape[1]  # at end
+            col_idx = self.x_nd  # at end
 
-        self.x = np.insert( self.x, col_idx, column, axis=1 )
+        table = np.insert( table, col_idx, column, axis=1 )
         self.x_names.insert(col_idx, name)
         self.x_longnames.insert(col_idx, longname)
-        self.x_units.insert(col_idx, unit)       # reset min, max and means
+        self.x_units.insert(col_idx, unit)
+        self._build_index()
         # need to increase x_nd
         self.x_nd = self.x_nd + 1
+        self._set_table(table)
         # reset min, max and means
-        self._set_minmaxmean_x()
+        self._x_versions.insert(col_idx, None)
+        self._set_minmaxmean_x([col_idx])
         return
 
 
@@ -381,25 +1327,32 @@ class AeroX:
         """ add a new column of output, default at end
         optionally before or after a named column """
         
-        if self.y.size == 0: 
+        table = self._xy()
+        if table.shape[1] == 0: 
             # case for empty need to set the number of rows to append axis=1
-            self.y = np.empty((column.size,0))
+            table = np.empty((column.size,0), dtype=self.dtype)
+            col_idx = 0
+        elif self.y_nd == 0:
             col_idx = 0
         elif before is not None:
-            col_idx = self.y_names.index(before)
+            col_idx = self.get_y_index(before)
         elif after is not None:
-            col_idx = self.y_names.index(after) + 1
+            col_idx = self.get_y_index(after) + 1
         else:
-            col_idx = self.y.shape[1]  # at end
+            col_idx = self.y_nd  # at end
 
-        self.y = np.insert( self.y, col_idx, column, axis=1 )
+        # outputs follow inputs in the table
+        table = np.insert( table, self.x_nd + col_idx, column, axis=1 )
         self.y_names.insert(col_idx, name)
         self.y_longnames.insert(col_idx, longname)
         self.y_units.insert(col_idx, unit)
+        self._build_index()
         # need to increase y_nd
         self.y_nd = self.y_nd + 1
+        self._set_table(table)
         # reset min, max and means
-        self._set_minmaxmean_y()
+        self._y_versions.insert(col_idx, None)
+        self._set_minmaxmean_y([col_idx])
         return
 
 
@@ -407,9 +1360,9 @@ class AeroX:
         """ delete  column with name """
         # dangerous to delete inputs, but may be case where column has 
         # identical values due to filtering and so is superfluous
-        try:
-            idx = self.x_names.index(name)
-            self.x = np.delete(self.x, idx, axis=1)    
+        side, idx = self._lookup(name)
+        if side == 'x':
+            table = np.delete(self._xy(), idx, axis=1)    
             del self.x_names[idx]     
             del self.x_longnames[idx] 
             del self.x_units[idx] 
@@ -418,12 +1371,14 @@ class AeroX:
             self.x_mean = np.delete(self.x_mean, idx)
             # need to reduce x_nd
             self.x_nd = self.x_nd - 1
+            self._set_table(table)
             # reset min, max and means
-            self._set_minmaxmean_x()
+            del self._x_versions[idx]
+            self._set_minmaxmean_x([])
             
-        except:        
-            idx = self.y_names.index(name)
-            self.y = np.delete(self.y, idx, axis=1)    
+        else:        
+            # outputs follow inputs in the table
+            table = np.delete(self._xy(), self.x_nd + idx, axis=1)    
             del self.y_names[idx]    
             del self.y_longnames[idx] 
             del self.y_units[idx] 
@@ -432,9 +1387,12 @@ class AeroX:
             self.y_mean = np.delete(self.y_mean, idx)
             # need to reduce y_nd
             self.y_nd = self.y_nd - 1
+            self._set_table(table)
             # reset min, max and means
-            self._set_minmaxmean_y()     
+            del self._y_versions[idx]
+            self._set_minmaxmean_y([])     
         
+        self._build_index()
         return
 
     def check_units(self):
@@ -447,55 +1405,65 @@ class AeroX:
             print('check_units unavailable, install pint')
             return
 
-        x_return = []
-        for unit in self.x_units:
-            # try creating a variable with this unit definition
-            try:
-                check = 1.0*self.units(unit)
-                x_return.append(True)
- 
-            except:
-                x_return.append(unit)
- 
-        y_return = []
-        for unit in self.y_units:
-            # try creating a variable with this unit definition
-            try:
-                check = 1.0*self.units(unit)
-                y_return.append(True)
- 
-            except:
-                y_return.append(unit)
-                
+        x_return = [True if valid_unit(unit) else unit for unit in self.x_units]
+        y_return = [True if valid_unit(unit) else unit for unit in self.y_units]
         return x_return, y_return
        
 
     def convert_units(self,name,new_units):
         """ 
         for column name change from current units to new unit
+        offset units such as degC and degF are converted correctly
         """ 
+        self.convert_all_units({name: new_units})
+        return
+
+
+    def convert_all_units(self, new_units=None, system=None, **kwargs):
+        """
+        convert many columns in one pass through the data
+        new_units is a dictionary of column name and new unit, the same can 
+        be given as keywords
+        system converts every other column to the base units of a pint 
+        system such as 'SI' or 'mks', units already in the system such as Pa
+        are kept and columns with units pint does not know are left alone
+        conversion factors are cached so converting many files is fast
+        raises ValueError before changing anything if a unit can't be converted
+        """
         if not use_pint:
             print('convert_units unavailable, install pint')
             return
         
-        try: # look for name in x
-            col = self.x_names.index(name)
-            current_units = self.x_units[col]
-            unit = 1.0*self.units(current_units)
-            scale = unit.to(new_units)
-            self.x[:,col] = self.x[:,col]*scale.magnitude
-            self.x_units[col] = new_units
-            self._set_minmaxmean_x()
- 
-        except: # then look for name in y
-            col = self.y_names.index(name)
-            current_units = self.y_units[col]
-            unit = 1.0*self.units(current_units)
-            scale = unit.to(new_units)
-            self.y[:,col] = self.y[:,col]*scale.magnitude
-            self.y_units[col] = new_units
-            self._set_minmaxmean_y()
-
+        new_units = dict(new_units or {}, **kwargs)
+        units = self.x_units + self.y_units
+        if system is not None:
+            targets = [system_unit(unit, system) for unit in units]
+        else:
+            targets = list(units)
+        for name, unit in new_units.items():
+            side, col = self._lookup(name)
+            targets[col if side == 'x' else self.x_nd + col] = unit
+        
+        # find all factors first so nothing changes if one fails
+        scale = np.ones(len(units)); offset = np.zeros(len(units))
+        changed = []
+        for i, (unit, target) in enumerate(zip(units, targets)):
+            if target != unit:
+                scale[i], offset[i] = unit_conversion(unit, target)
+                changed.append(i)
+        
+        if not changed:
+            return
+        
+        # only the changed columns are read and written
+        table = self._xy()
+        table[:, changed] = table[:, changed]*scale[changed] + offset[changed]
+        self.x_units = targets[:self.x_nd]
+        self.y_units = targets[self.x_nd:]
+        if changed[0] < self.x_nd:
+            self._set_minmaxmean_x([i for i in changed if i < self.x_nd])
+        if changed[-1] >= self.x_nd:
+            self._set_minmaxmean_y([i - self.x_nd for i in changed if i >= self.x_nd])
         return
 
 
@@ -520,60 +1488,234 @@ class AeroX:
         return x_norm
  
         
-    def add_interpolator(self, interpolator='nearest' ):
-        """ create private interpolator """
+    def add_interpolator(self, interpolator='nearest', grid=True, neighbors=None, 
+                         kernel='thin_plate_spline', smoothing=0.0, epsilon=None,
+                         tiles=None, filename=None):
+        """ set up private interpolator, fitted when first used and refitted 
+        when the data changes
+        if grid is True and the inputs form a full tensor product grid, in any
+        row order, linear and nearest use a fast regular grid interpolator 
+        RBF is global by default, setting neighbors fits local RBF to that 
+        number of nearest points which scales to large data, kernel, smoothing
+        and epsilon are passed to scipy RBFInterpolator 
+        linear and nearest of large scattered data can be split into tiles 
+        parts for each input, fitting each tile only when it is first used
+        if filename is given a previously saved interpolator for the same 
+        data and options is loaded from it, otherwise the new one is saved """
         if not self.constants:
-            # normalize inputs, important for RBF
-            x_norm = self._normalize(self.x)
-            if interpolator == 'RBF':                
-                self._interp = RBFInterpolator(x_norm,self.y)
-            elif interpolator == 'linear':
-                self._interp = LinearNDInterpolator(x_norm,self.y)
-            else:
-                # default is guaranteed to work
-                self._interp = NearestNDInterpolator(x_norm,self.y)
+            options = {'interpolator': interpolator, 'grid': grid, 
+                       'neighbors': neighbors, 'kernel': kernel, 
+                       'smoothing': smoothing, 'epsilon': epsilon, 'tiles': tiles}
+            self._interp_options = options
+            if filename is not None:
+                if os.path.exists(filename):
+                    try:
+                        self.load_interpolator(filename, options)
+                        return
+                    except ValueError as error:
+                        print(f'Warning: refitting interpolator, {error}')
+                self.save_interpolator(filename)
             return
         else:
-            return # really need to throw an exception
+            return # really need to throw an exception
+    
+    
+    def _interpolator(self, options=None, outputs=None):
+        """ 
+        return fitted interpolator and block size for the options of 
+        add_interpolator and tuple of output columns, None for all outputs
+        fitted interpolators are kept until the inputs or their outputs change
+        outputs are taken from the interpolator of all outputs if one is 
+        cached or loaded and up to date for them, otherwise an interpolator 
+        is fitted to those outputs only
+        """
+        if self._interp_options is None:
+            self.add_interpolator()
+        if options is None:
+            options = self._interp_options
+        
+        # a change to the inputs makes all fitted interpolators stale,
+        # a change to an output only those fitted to it
+        self._xy() # new versions if x or y was replaced
+        x_versions = tuple(self._x_versions)
+        for key in [key for key, entry in self._interps.items() if entry[0] != x_versions]:
+            del self._interps[key]
+        
+        # keyed by the versions of the outputs, so a changed output has a new key
+        if outputs is None:
+            y_versions = tuple(self._y_versions)
+            key = (tuple(options.items()), None)
+        else:
+            y_versions = tuple(self._y_versions[col] for col in outputs)
+            key = (tuple(options.items()), y_versions)
+        entry = self._interps.get(key)
+        if entry is not None and entry[1] == y_versions:
+            self._interps.move_to_end(key)
+            return entry[2], entry[3]
+        
+        full = None
+        if outputs is not None:
+            full = self._interps.get((tuple(options.items()), None))
+            if full is not None and all(version in full[1] for version in y_versions):
+                columns = [full[1].index(version) for version in y_versions]
+                return ColumnInterpolator(full[2], columns), full[3]
+            
+        from scipy.interpolate import LinearNDInterpolator
+        y = self.y if outputs is None else self.y[:,list(outputs)]
+        if full is not None and isinstance(full[2], LinearNDInterpolator):
+            # linear interpolators of other outputs share the triangulation
+            interp, block_rows = LinearNDInterpolator(full[2].tri, y), full[3]
+        else:
+            interp, block_rows = fit_interpolator(self._normalize(self.x), y, **options)
+        self._cache_interpolator(key, interp, block_rows, x_versions, y_versions)
+        return interp, block_rows
+    
+    
+    def _cache_interpolator(self, key, interp, block_rows, x_versions, y_versions):
+        """ keep a fitted interpolator, dropping the least recently used """
+        self._interps[key] = (x_versions, y_versions, interp, block_rows)
+        self._interps.move_to_end(key)
+        while len(self._interps) > interpolator_cache_size:
+            self._interps.popitem(last=False)
+
+
+    def save_interpolator(self, filename):
+        """ 
+        save the fitted interpolator to filename so it can be reloaded 
+        without refitting, stored with a fingerprint of the data
+        """
+        interp, block_rows = self._interpolator()
+        state = {'format': 'AeroX interpolator', 
+                 'fingerprint': array_fingerprint(self.x, self.y),
+                 'options': self._interp_options,
+                 'block_rows': block_rows,
+                 'interp': interp}
+        
+        # write to temporary file and rename so a partial file is never seen
+        tmpname = os.fspath(filename) + '.tmp'
+        with open(tmpname, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, filename)
+        
+        
+    def load_interpolator(self, filename, options=None):
+        """ 
+        load an interpolator saved by save_interpolator
+        raises ValueError if it can't be read, such as a truncated file or 
+        one saved with another version of scipy, if it was fitted to 
+        different data, or with different options if these are given 
+        as a dictionary 
+        uses pickle so only load files from a trusted source
+        """
+        with open(filename, 'rb') as f:
+            try:
+                state = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+                    IndexError, TypeError) as error:
+                raise ValueError(f'unable to read {filename}, {type(error).__name__} '
+                                 f'{error}') from error
+            
+        keys = {'format', 'fingerprint', 'options', 'block_rows', 'interp'}
+        if (not isinstance(state, dict) or not keys <= state.keys() or 
+            state['format'] != 'AeroX interpolator'):
+            raise ValueError(f'{filename} is not a saved interpolator')
+        if state['fingerprint'] != array_fingerprint(self.x, self.y):
+            raise ValueError(f'{filename} was fitted to different data')
+        if options is not None and state['options'] != options:
+            raise ValueError(f'{filename} was fitted with different options')
+        
+        self._interp_options = state['options']
+        self._xy() # new versions if x or y was replaced
+        key = (tuple(self._interp_options.items()), None)
+        self._cache_interpolator(key, state['interp'], state['block_rows'],
+                                 tuple(self._x_versions), tuple(self._y_versions))
     
         
-    def interpolate(self,x):
-        """ interpolate the outputs y based on array of inputs """
+    def interpolate(self, x, outputs=None, interpolator=None, workers=None,
+                    processes=False):
+        """ interpolate the outputs y based on array of inputs 
+        optional list of output names to only evaluate those columns 
+        and interpolator to use another method with the same options
+        evaluated in blocks of rows to bound memory use, on a pool of 
+        workers threads if more than one, or processes which are each 
+        sent the interpolator once """
+        options = None
+        if interpolator is not None:
+            if self._interp_options is None:
+                self.add_interpolator()
+            options = dict(self._interp_options, interpolator=interpolator)
+        if outputs is not None:
+            outputs = tuple(self.get_y_index(name) for name in outputs)
+        interp, block_rows = self._interpolator(options, outputs)
+        
         # interpolator works on normalised inputs
         x_norm = self._normalize(x)
-        y = self._interp(x_norm) 
+        nrows = x_norm.shape[0]
+        workers = interpolate_workers if workers is None else workers
+        if workers > 1:
+            # at least one block per worker, unless blocks get too small
+            block_rows = min(block_rows, max(1000, -(-nrows//workers)))
+        if nrows <= block_rows:
+            return interp(x_norm) 
+        
+        y = np.empty((nrows, self.y_nd if outputs is None else len(outputs)))
+        starts = range(0, nrows, block_rows)
+        blocks = (x_norm[start:start+block_rows] for start in starts)
+        if workers > 1 and processes:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(workers, initializer=_set_worker_interpolator, 
+                                     initargs=(interp,)) as pool:
+                for start, y_block in zip(starts, pool.map(_worker_interpolate, blocks)):
+                    y[start:start+block_rows] = y_block
+        elif workers > 1:
+            # scipy evaluates without holding the GIL for much of the time
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(workers) as pool:
+                for start, y_block in zip(starts, pool.map(interp, blocks)):
+                    y[start:start+block_rows] = y_block
+        else:
+            for start, y_block in zip(starts, map(interp, blocks)):
+                y[start:start+block_rows] = y_block
         return y
  
     
     def interpolate_y(self, name, **kwargs):
-        """ find single value of y with name based on series of input values
+        """ find value of y with name based on series of input values
+        inputs may be numbers or arrays that broadcast together, giving an 
+        array of results from one call to the interpolator
         any undefined inputs are set to the mean"""
-        # find column index of output for required name
-        ycol = self.y_names.index(name)
+        # check output name before doing any work
+        self.get_y_index(name)
+        
+        # input values broadcast to a common shape, a single value if all are numbers
+        xcols = [self.get_x_index(keyword) for keyword in kwargs]
+        values = np.broadcast_arrays(*[np.asarray(value, dtype=float) 
+                                       for value in kwargs.values()])
+        shape = values[0].shape if values else ()
  
         # set default inputs for interpolation as the means
-        x = self.x_mean.copy() # avoid having a view that over-writes x_mean
-        x = np.reshape(x, (1,-1))
+        x = np.empty((int(np.prod(shape)), self.x_nd))
+        x[:] = self.x_mean
  
-        # go through keyword arguments
-        for keyword, value in kwargs.items():
-            # find column index of input for keyword argument
-            xcol = self.x_names.index(keyword)
+        for xcol, value in zip(xcols, values):
             # ensure inputs are within allowable range of data
             minval = self.x_min[xcol]; maxval = self.x_max[xcol]
-            x[0,xcol] = np.clip(value, minval, maxval)
+            x[:,xcol] = np.clip(value.ravel(), minval, maxval)
                        
-        # use interpolator set up previously
-        y = self.interpolate(x)
+        # use interpolator set up previously, evaluated for this output
+        y = self.interpolate(x, outputs=[name])[:,0]
         
-        # y contains all outputs, just need to return value for name           
-        return y[0,ycol]
+        if shape == ():
+            return y[0]
+        return y.reshape(shape)
  
        
-    def plot(self, xname, yname, interpolate=False, resolution=50, **kwargs):
+    def plot(self, xname, yname, interpolate=False, resolution=50, query=None, **kwargs):
         """ line plotting of xname vs yname, use input values to downselect
         default is discrete points, if interpolation available will show smooth
-        line with resolution points """
+        line with resolution points, optional Query further selects points """
+        import matplotlib.pyplot as plt
+        
         # extract columns
         x_i = self.get_x(xname);  y_i = self.get_y(yname)
         
@@ -584,7 +1726,7 @@ class AeroX:
         x_unit = self.x_units[x_index];     y_unit = self.y_units[y_index]
         
         # mask to keep rows corresponding to keyword arguments
-        mask = self._set_mask(**kwargs)
+        mask = self._set_mask(query, **kwargs)
         # default mode store for points, may be empty!
         x_i_points = x_i[mask];    y_i_points = y_i[mask]
          
@@ -596,7 +1738,7 @@ class AeroX:
             # go through keyword arguments
             for keyword, value in kwargs.items():
                 # find column index of input for keyword argument
-                xcol = self.x_names.index(keyword)
+                xcol = self.get_x_index(keyword)
                 # ensure inputs are within allowable range of data
                 minval = self.x_min[xcol]; maxval = self.x_max[xcol]
                 x[0,xcol] = np.clip(value, minval, maxval)
@@ -628,10 +1770,13 @@ class AeroX:
         plt.show()
  
         
-    def plot_2d(self, x1name, x2name, yname, interpolate=False, resolution=50, **kwargs):
+    def plot_2d(self, x1name, x2name, yname, interpolate=False, resolution=50, 
+                query=None, **kwargs):
         """ contour plotting with 2 inputs and 1 output, use input values to downselect
         default is to triangulate points, if interpolation available will use
-        that function with resolution points """
+        that function with resolution points, optional Query further selects points """
+        import matplotlib.pyplot as plt
+        
         # extract columns
         x1_i = self.get_x(x1name);  x2_i = self.get_x(x2name)
         y_i = self.get_y(yname)
@@ -654,7 +1799,7 @@ class AeroX:
             # go through keyword arguments
             for keyword, value in kwargs.items():
                 # find column index of input for keyword argument
-                xcol = self.x_names.index(keyword)
+                xcol = self.get_x_index(keyword)
                 # ensure inputs are within allowable range of data
                 minval = self.x_min[xcol]; maxval = self.x_max[xcol]
                 x[0,xcol] = np.clip(value, minval, maxval)
@@ -696,7 +1841,7 @@ class AeroX:
             
         else:
             # mask to keep rows corresponding to keyword arguments
-            mask = self._set_mask(**kwargs)
+            mask = self._set_mask(query, **kwargs)
             # default mode store for points, may be empty!
             x1_i_points = x1_i[mask];   x2_i_points = x2_i[mask];   
             y_i_points = y_i[mask]
@@ -715,7 +1860,663 @@ class AeroX:
 
         return
 
+class Query:
+    """
+    selection of rows by the values of inputs and outputs
+    each keyword is a condition on the column with that name and 
+    all conditions must hold, the value of a condition can be
+        a number            match within tolerance as np.isclose
+        np.nan              match NaN
+        (lower, upper)      inclusive range, None for no bound so 
+                            (None, None) matches any value that is not NaN
+        [v1, v2, ...]       match any of the values, may include np.nan
+    rtol and atol are the tolerances, either a number for all columns
+    or a dictionary of column name and tolerance
+    queries are combined with | to match either and & to match both
+    for example Query(alpha=(-2, 8), Re=[1E6, 2E6]) | Query(CM=np.nan)
+    """
+    def __init__(self, rtol=1.0e-5, atol=1.0e-8, **conditions):
+        group = []
+        for name, value in conditions.items():
+            name_rtol = rtol.get(name, 1.0e-5) if isinstance(rtol, dict) else rtol
+            name_atol = atol.get(name, 1.0e-8) if isinstance(atol, dict) else atol
+            group.append((name, value, name_rtol, name_atol))
+        # list of alternative groups of conditions
+        self.groups = [group]
+        
+        
+    def __or__(self, other):
+        query = Query()
+        query.groups = self.groups + other.groups
+        return query
+    
+    
+    def __and__(self, other):
+        query = Query()
+        query.groups = [group + other_group for group in self.groups 
+                        for other_group in other.groups]
+        return query
+    
+    
+    def mask(self, data):
+        """ return boolean mask of the rows of AeroX object data that match """
+        nrows = data.x.shape[0]
+        if self.groups == [[]]: # no conditions
+            return np.full(nrows, True)
+        
+        mask = np.full(nrows, False)
+        for group in self.groups:
+            mask[data._find_rows(group)] = True
+        return mask
+    
+    
+class GridInterpolator:
+    """
+    interpolation of data on a full tensor product grid of inputs
+    the rows are reshaped onto the grid and scipy RegularGridInterpolator
+    is used, inputs with a single value are ignored
+    outside the grid linear gives NaN as for LinearNDInterpolator
+    and nearest gives the nearest point as for NearestNDInterpolator
+    """
+    def __init__(self, axes, dims, values, method='linear'):
+        from scipy.interpolate import RegularGridInterpolator
+        self.dims = dims # columns of inputs that vary
+        fill_value = None if method == 'nearest' else np.nan
+        self._interp = RegularGridInterpolator(axes, values, method=method,
+                                               bounds_error=False, fill_value=fill_value)
+        
+        
+    @classmethod
+    def from_scattered(cls, x, y, method='linear'):
+        """
+        create from rows of inputs x and outputs y if they form a grid
+        returns None if not
+        """
+        found = grid_axes(x)
+        if found is None:
+            return None
+        axes, dims, flat = found
+        
+        # place each row at its grid position
+        shape = tuple(axis.size for axis in axes)
+        values = np.empty((flat.size, y.shape[1]))
+        values[flat] = y
+        return cls(axes, dims, values.reshape(shape + (y.shape[1],)), method)
+    
+    
+    def __call__(self, x):
+        return self._interp(x[:, self.dims])
+    
+    
+class TiledInterpolator:
+    """
+    interpolation of large scattered data split into tiles of the inputs
+    the normalised inputs are divided into tiles equal parts for each 
+    input that varies, the interpolator for a tile is fitted when first 
+    queried to the points within the tile widened by overlap of its size 
+    on each side, so away from the edges of tiles it matches the global 
+    interpolator, tiles with too few points are widened further
+    fitted tiles are kept up to cache_bytes, least recently used first out 
+    """
+    def __init__(self, x, y, method='linear', tiles=8, overlap=0.25, 
+                 cache_bytes=None):
+        self.dims = np.flatnonzero(np.ptp(x, axis=0) > 0.0) # inputs that vary
+        self.x = x[:, self.dims]
+        self.y = y
+        self.method = method
+        self.tiles = tiles
+        self.overlap = overlap
+        self.cache_bytes = tile_cache_bytes if cache_bytes is None else cache_bytes
+        self._lower = np.min(self.x, axis=0)
+        self._size = (np.max(self.x, axis=0) - self._lower)/tiles
+        # points sorted by tile, points of tile key are order[starts[key]:starts[key+1]]
+        keys = self._keys(self.x)
+        self._order = np.argsort(keys, kind='stable')
+        self._starts = np.searchsorted(keys[self._order], np.arange(tiles**len(self.dims) + 1))
+        self._tiles = collections.OrderedDict() # tile to interpolator and bytes
+        self._nbytes = 0
+        self._lock = threading.Lock() # may be called from several threads
+        
+        
+    def __getstate__(self):
+        # fitted tiles and lock are not saved
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_tiles'] = collections.OrderedDict()
+        state['_nbytes'] = 0
+        return state
+    
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        
+        
+    def _keys(self, x):
+        """ tile of each point, points outside the data use the nearest tile """
+        index = np.floor((x - self._lower)/self._size)
+        index = np.clip(np.nan_to_num(index), 0, self.tiles - 1).astype(int)
+        return np.ravel_multi_index(index.T, (self.tiles,)*len(self.dims))
+    
+    
+    def __call__(self, x):
+        x = x[:, self.dims]
+        keys = self._keys(x)
+        
+        # evaluate points of each tile together
+        y = np.empty((x.shape[0], self.y.shape[1]))
+        order = np.argsort(keys, kind='stable')
+        tile_keys, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], x.shape[0])
+        for key, start, end in zip(tile_keys, starts, ends):
+            rows = order[start:end]
+            y[rows] = self._tile(key)(x[rows])
+        return y
+    
+    
+    def _tile(self, key):
+        """ return interpolator of tile with key, fitted if not in cache """
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key][0]
+        
+        interp = self._fit_tile(key)
+        nbytes = interp_nbytes(interp)
+        with self._lock:
+            if key not in self._tiles:
+                self._tiles[key] = (interp, nbytes)
+                self._nbytes = self._nbytes + nbytes
+            while self._nbytes > self.cache_bytes and len(self._tiles) > 1:
+                _, (_, dropped) = self._tiles.popitem(last=False)
+                self._nbytes = self._nbytes - dropped
+        return interp
+    
+    
+    def _fit_tile(self, key):
+        """ fit interpolator to the points in and around tile with key """
+        from scipy.spatial import QhullError
+        from scipy.interpolate import LinearNDInterpolator
+        from scipy.interpolate import NearestNDInterpolator
+        
+        shape = (self.tiles,)*len(self.dims)
+        index = np.array(np.unravel_index(key, shape))
+        tile_lower = self._lower + index*self._size
+        tile_upper = tile_lower + self._size
+        pad = self.overlap*self._size
+        while True:
+            # candidate points from the tiles the widened tile overlaps
+            first = np.maximum(np.floor((tile_lower - pad - self._lower)/self._size), 0)
+            last = np.minimum(np.floor((tile_upper + pad - self._lower)/self._size), self.tiles - 1)
+            near = np.ravel_multi_index(np.meshgrid(*[np.arange(i, j + 1, dtype=int) 
+                                                      for i, j in zip(first, last)]), shape)
+            rows = np.concatenate([self._order[self._starts[k]:self._starts[k+1]] 
+                                   for k in near.ravel()])
+            x = self.x[rows]
+            inside = np.all((x >= tile_lower - pad) & (x <= tile_upper + pad), axis=1)
+            rows = rows[inside]
+            
+            everything = np.all(pad >= self.tiles*self._size)
+            if rows.size > len(self.dims) or everything:
+                try:
+                    if self.method == 'linear':
+                        return LinearNDInterpolator(self.x[rows], self.y[rows])
+                    return NearestNDInterpolator(self.x[rows], self.y[rows])
+                except QhullError:
+                    if everything:
+                        raise
+            # not enough points to fit, widen tile
+            pad = 2.0*pad + self._size
+        
+        
+class ColumnInterpolator:
+    """
+    some of the outputs of an interpolator, in the order of columns
+    """
+    def __init__(self, interp, columns):
+        self.interp = interp
+        self.columns = columns
+        
+        
+    def __call__(self, x):
+        return self.interp(x)[:, self.columns]
+        
+        
+class RunningStats:
+    """
+    running min, max and mean of the columns of a sequence of 2d arrays
+    each block is merged into the mean weighted by its number of rows,
+    which stays accurate for long streams unlike a running sum
+    """
+    def __init__(self):
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.mean = None
+        
+        
+    def update(self, block):
+        """ merge the rows of a 2d array into the statistics """
+        n = block.shape[0]
+        if n == 0:
+            return
+        
+        block_min = np.min(block, axis=0)
+        block_max = np.max(block, axis=0)
+        block_mean = np.mean(block, axis=0, dtype=np.float64)
+        
+        if self.count == 0:
+            self.min = block_min
+            self.max = block_max
+            self.mean = block_mean
+        else:
+            self.min = np.minimum(self.min, block_min)
+            self.max = np.maximum(self.max, block_max)
+            self.mean = self.mean + (block_mean - self.mean)*(n/(self.count + n))
+        self.count = self.count + n
+        
+        
+    def copy(self):
+        """ return an independent copy of the current statistics """
+        stats = RunningStats()
+        stats.count = self.count
+        if self.count > 0:
+            stats.min = self.min.copy()
+            stats.max = self.max.copy()
+            stats.mean = self.mean.copy()
+        return stats
+    
+
+class Catalog:
+    """
+    index of the AeroX files in a directory tree stored in an SQLite 
+    database, only the comments and header of each file are read so 
+    finding files by column name, unit, range of values or comment text 
+    does not need to open them, scans only read files that have changed
+    ranges of values need the whole file to be read and are optional
+    """
+    def __init__(self, database='aerox_catalog.sqlite'):
+        import sqlite3
+        self.database = database
+        self._db = sqlite3.connect(database)
+        with self._db:
+            self._db.execute('''CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, 
+                ranges INTEGER, nrows INTEGER, comments TEXT, error TEXT)''')
+            self._db.execute('''CREATE TABLE IF NOT EXISTS columns (
+                path TEXT, kind TEXT, position INTEGER, name TEXT, 
+                longname TEXT, unit TEXT, min REAL, max REAL)''')
+            self._db.execute('''CREATE INDEX IF NOT EXISTS columns_name 
+                ON columns (name)''')
+            self._db.execute('''CREATE INDEX IF NOT EXISTS columns_path 
+                ON columns (path)''')
+            
+            
+    def close(self):
+        self._db.close()
+        
+        
+    def scan(self, directory, pattern='*.csv', ranges=False):
+        """
+        add files in directory and below matching pattern to the catalog,
+        files already indexed are only read again if their modification 
+        time or size has changed, or ranges is True and they were indexed 
+        without ranges, files that were removed are dropped
+        returns the number of files read
+        """
+        directory = os.path.abspath(directory)
+        known = {path: (mtime_ns, size, has_ranges) for path, mtime_ns, size, has_ranges 
+                 in self._db.execute('SELECT path, mtime_ns, size, ranges FROM files')
+                 if path.startswith(directory + os.sep)}
+        
+        nread = 0
+        with self._db:
+            for root, dirs, files in os.walk(directory):
+                for filename in fnmatch.filter(files, pattern):
+                    path = os.path.join(root, filename)
+                    stat = os.stat(path)
+                    previous = known.pop(path, None)
+                    if previous is not None:
+                        mtime_ns, size, has_ranges = previous
+                        if (mtime_ns == stat.st_mtime_ns and size == stat.st_size 
+                            and (has_ranges or not ranges)):
+                            continue
+                    self._add(path, stat, ranges)
+                    nread = nread + 1
+            
+            # anything left was not found
+            for path in known:
+                self._remove(path)
+        return nread
+    
+    
+    def _add(self, path, stat, ranges):
+        """ read header of file at path and replace its entries """
+        self._remove(path)
+        try:
+            data = AeroX(path, lazy=True)
+            x_stats = RunningStats(); y_stats = RunningStats()
+            if ranges:
+                for chunk in AeroX.iter_chunks(path):
+                    x_stats = chunk.x_running; y_stats = chunk.y_running
+        except (ValueError, IndexError, UnicodeDecodeError, OSError, EOFError) as error:
+            # not an AeroX file or can't be read, such as a truncated or 
+            # corrupt compressed file or no permission, kept so it is not 
+            # read again until it changes
+            self._db.execute('INSERT INTO files VALUES (?,?,?,?,?,?,?)', 
+                             (path, stat.st_mtime_ns, stat.st_size, ranges, 
+                              None, None, str(error)))
+            return
+        
+        rows = []
+        for kind, names, longnames, units, stats in (
+                ('x', data.x_names, data.x_longnames, data.x_units, x_stats),
+                ('y', data.y_names, data.y_longnames, data.y_units, y_stats)):
+            for i, name in enumerate(names):
+                if stats.count > 0:
+                    lower = float(stats.min[i]); upper = float(stats.max[i])
+                else:
+                    lower = None; upper = None
+                rows.append((path, kind, i, name, longnames[i], units[i], lower, upper))
+        nrows = max(x_stats.count, y_stats.count) if ranges else None
+        self._db.execute('INSERT INTO files VALUES (?,?,?,?,?,?,?)', 
+                         (path, stat.st_mtime_ns, stat.st_size, ranges, nrows, 
+                          '\n'.join(data.comments), None))
+        self._db.executemany('INSERT INTO columns VALUES (?,?,?,?,?,?,?,?)', rows)
+        
+        
+    def _remove(self, path):
+        self._db.execute('DELETE FROM files WHERE path = ?', (path,))
+        self._db.execute('DELETE FROM columns WHERE path = ?', (path,))
+        
+        
+    def find(self, comment=None, unit=None, **columns):
+        """
+        return sorted list of paths of files matching all of the conditions
+        comment is text in the comments, ignoring case
+        unit is the unit of any column
+        each other keyword is a column name, with value
+            None                the file has the column
+            a number            the range of the column includes the number
+            (lower, upper)      the range of the column overlaps, None for 
+                                no bound
+        ranges are only known for files scanned with ranges=True
+        """
+        conditions = ['error IS NULL']; parameters = []
+        if comment is not None:
+            conditions.append('instr(lower(comments), lower(?)) > 0')
+            parameters.append(comment)
+        if unit is not None:
+            conditions.append('path IN (SELECT path FROM columns WHERE unit = ?)')
+            parameters.append(unit)
+        for name, value in columns.items():
+            condition = 'path IN (SELECT path FROM columns WHERE name = ?'
+            parameters.append(name)
+            if value is not None:
+                lower, upper = value if isinstance(value, tuple) else (value, value)
+                if lower is not None:
+                    condition = condition + ' AND max >= ?'
+                    parameters.append(lower)
+                if upper is not None:
+                    condition = condition + ' AND min <= ?'
+                    parameters.append(upper)
+            conditions.append(condition + ')')
+        
+        sql = 'SELECT path FROM files WHERE ' + ' AND '.join(conditions) + ' ORDER BY path'
+        return [path for (path,) in self._db.execute(sql, parameters)]
+    
+    
+    def check_units(self):
+        """
+        test the units of every column of every file in the catalog,
+        each different unit is only checked once
+        return sorted list of (path, name, unit) of the columns whose 
+        unit is not consistent with pint definitions
+        """
+        if not use_pint:
+            print('check_units unavailable, install pint')
+            return
+        
+        invalid = [unit for (unit,) in self._db.execute('SELECT DISTINCT unit FROM columns')
+                   if not valid_unit(unit)]
+        if not invalid:
+            return []
+        sql = ('SELECT path, name, unit FROM columns WHERE unit IN (' + 
+               ','.join('?'*len(invalid)) + ') ORDER BY path, kind, position')
+        return self._db.execute(sql, invalid).fetchall()
+    
+    
 # utility functions
+@functools.lru_cache(maxsize=None)
+def unit_registry(exact=False):
+    """
+    Convenience function to create the pint unit registry on first use,
+    subsequent calls return the same registry
+    exact gives a separate registry using fractions, for conversion 
+    factors without rounding errors
+    """
+    import pint
+    if exact:
+        return pint.UnitRegistry(system='SI', non_int_type=fractions.Fraction)
+    return pint.UnitRegistry(system='SI')
+
+
+@functools.lru_cache(maxsize=None)
+def unit_conversion(from_unit, to_unit):
+    """
+    Convenience function to find scale and offset to convert values in 
+    from_unit to to_unit as value*scale + offset, the offset is zero 
+    except for temperatures such as degC, raises ValueError if pint is 
+    unavailable or the units can't be converted
+    found with fractions and rounded once, so degC to degF gives exactly 
+    1.8 and 32.0, the scale is a difference of temperatures such as 
+    delta_degC converted to delta_degF
+    """
+    if not use_pint:
+        raise ValueError(f'converting {from_unit} to {to_unit} needs pint')
+    units = unit_registry(exact=True)
+    zero = fractions.Fraction(0); one = fractions.Fraction(1)
+    try:
+        # checked with the usual registry first, its errors can be printed
+        unit_registry().Quantity(1.0, from_unit).to(to_unit)
+        offset = units.Quantity(zero, from_unit).to(to_unit).magnitude
+        delta = units.Quantity(one, from_unit) - units.Quantity(zero, from_unit)
+        to_delta = units.Quantity(one, to_unit) - units.Quantity(zero, to_unit)
+        scale = delta.to(to_delta.units).magnitude
+    except Exception as error: # pint has several errors for undefined or incompatible units
+        raise ValueError(f'unable to convert {from_unit} to {to_unit}, {error}')
+    return float(scale), float(offset)
+
+
+@functools.lru_cache(maxsize=None)
+def valid_unit(unit):
+    """
+    Convenience function to check if pint understands unit, 
+    cached so checking many files only parses each unit once
+    """
+    try:
+        unit_registry().Quantity(1.0, unit)
+    except Exception: # pint has several errors for undefined units
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def system_unit(unit, system):
+    """
+    Convenience function to find the unit in base units of a pint system
+    that unit converts to, unit is returned unchanged if it is already 
+    in the system or pint does not know it
+    """
+    if not valid_unit(unit):
+        return unit
+    units = unit_registry()
+    factor, base = units.get_base_units(unit, system=system)
+    target = f'{base:~C}'
+    scale, offset = unit_conversion(unit, target)
+    if abs(scale - 1.0) < 1.0e-12 and offset == 0.0:
+        return unit
+    return target
+
+
+def column_conversion(names, units, other_names, other_units):
+    """
+    Convenience function to match columns with other_names and other_units 
+    to names and units, returns list of the other column for each name and
+    arrays of scale and offset to convert to units
+    raises ValueError if the names are not the same
+    """
+    if sorted(other_names) != sorted(names):
+        raise ValueError(f'columns {other_names} do not match {names}')
+    order = [other_names.index(name) for name in names]
+    scale = np.ones(len(names)); offset = np.zeros(len(names))
+    for i, col in enumerate(order):
+        if other_units[col] != units[i]:
+            scale[i], offset[i] = unit_conversion(other_units[col], units[i])
+    return order, scale, offset
+
+
+def write_all(fd, data):
+    """
+    Convenience function to write all bytes of data to file descriptor fd,
+    os.write may write less than asked for
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def update_column_stats(values, cols, mins, maxs, means):
+    """
+    Convenience function to recompute min, max and mean of the list of 
+    columns cols of 2d array values, returns new arrays of min, max and 
+    mean with the other columns copied from mins, maxs and means
+    """
+    mins = np.array(mins); maxs = np.array(maxs); means = np.array(means)
+    if len(cols) > 0:
+        block = values[:, cols]
+        mins[cols] = np.min(block, axis=0)
+        maxs[cols] = np.max(block, axis=0)
+        means[cols] = np.mean(block, axis=0, dtype=np.float64)
+    return mins, maxs, means
+
+
+def resize_rows(array, rows, capacity):
+    """
+    Convenience function to copy the first rows of an array into a new 
+    array with capacity rows
+    """
+    resized = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    resized[:rows] = array[:rows]
+    return resized
+
+
+def copy_columns(source, target, order, scale, offset):
+    """
+    Convenience function to copy columns of source in order into target,
+    converting as value*scale + offset
+    """
+    if order == list(range(len(order))):
+        target[:] = source
+    elif source.dtype == target.dtype:
+        np.take(source, order, axis=1, out=target)
+    else:
+        target[:] = source[:, order]
+    if np.any(scale != 1.0):
+        target *= scale
+    if np.any(offset != 0.0):
+        target += offset
+
+
+def compression(filename, mode='r'):
+    """
+    Convenience function to find how filename is compressed, 'gzip', 'bz2',
+    'lzma' or None, from the first bytes of an existing file unless it is 
+    being written, otherwise from the extension
+    filename may be a string or path
+    """
+    filename = os.fspath(filename)
+    if mode != 'w' and os.path.exists(filename):
+        with open(filename, 'rb') as f:
+            start = f.read(6)
+        for kind, (magic, extension) in compression_formats.items():
+            if start.startswith(magic):
+                return kind
+        return None
+    
+    for kind, (magic, extension) in compression_formats.items():
+        if filename.endswith(extension):
+            return kind
+    return None
+
+
+def open_file(filename, mode='r', compresslevel=None):
+    """
+    Convenience function to open filename as text, files compressed with 
+    gzip, bz2 or xz are decompressed or compressed as they are read or 
+    written, compresslevel from 1 to 9 defaults to compress_level
+    """
+    kind = compression(filename, mode)
+    if kind is None:
+        return open(filename, mode)
+    
+    module = importlib.import_module(kind)
+    if mode == 'r':
+        return module.open(filename, 'rt')
+    level = compress_level if compresslevel is None else compresslevel
+    if kind == 'lzma':
+        return module.open(filename, mode + 't', preset=level)
+    return module.open(filename, mode + 't', compresslevel=level)
+
+
+def compress_bytes(kind, data, compresslevel=None):
+    """
+    Convenience function to compress data as a complete gzip, bz2 or xz 
+    stream, which can be added to the end of a compressed file
+    """
+    module = importlib.import_module(kind)
+    level = compress_level if compresslevel is None else compresslevel
+    if kind == 'lzma':
+        return module.compress(data, preset=level)
+    return module.compress(data, compresslevel=level)
+
+
+def is_binary(filename):
+    """
+    Convenience function to check if filename is a binary AeroX file
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(binary_magic)) == binary_magic
+
+
+def align_offset(offset, alignment=64):
+    """
+    Convenience function to round offset up to a multiple of alignment
+    """
+    return -(-offset // alignment)*alignment
+
+
+def binary_column(filename, offset, dtype, nrows):
+    """
+    Convenience function to memory map a column of nrows values of dtype 
+    at offset in filename, read only, pages are only read when used
+    """
+    if nrows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(nrows,))
+
+
+def same_view(a, b):
+    """
+    Convenience function to check if two arrays are the same view 
+    of the same memory, so x and y can be checked against the table
+    """
+    if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray):
+        return False
+    return (a.shape == b.shape and a.strides == b.strides and a.dtype == b.dtype and
+            a.__array_interface__['data'][0] == b.__array_interface__['data'][0])
+
+
 def extract_array(string_list, start_index, col_start, col_end,
                   delimiter_char=',', string=False):
     """
@@ -753,6 +2554,241 @@ def extract_array(string_list, start_index, col_start, col_end,
     return array 
 
 
+def extract_body(string_list, start_index, x_nd, y_nd, delimiter_char=',',
+                 dtype=np.float64):
+    """
+    Convenience function for reading the body of numeric data in one pass
+    the numeric columns are parsed together by numpy into one table of dtype,
+    inputs first then outputs, the optional identifier is returned as 
+    (codes, names) so repeated identifiers are only stored once, lines are
+    only split again to find it if some line has more fields than numbers
+    falls back to extract_array if any value can't be converted to a float
+    """
+    lines = string_list[start_index:]
+    n_num = x_nd + y_nd
+    table = None
+    if lines and n_num > 0:
+        # no argument splits on multiple spaces
+        delimiter = None if delimiter_char == ' ' else delimiter_char
+        try:
+            table = np.loadtxt(lines, delimiter=delimiter, usecols=range(n_num),
+                               comments=None, ndmin=2, dtype=dtype)
+        except ValueError:
+            # slow path below reports and skips the values that are not valid floats
+            table = None
+            
+    if table is None:
+        x = extract_array(string_list, start_index, 0, x_nd, delimiter_char)
+        y = extract_array(string_list, start_index, x_nd, n_num, delimiter_char)
+        columns = [np.reshape(a, (len(lines), -1)) for a in (x, y) if len(a)]
+        if columns:
+            table = np.column_stack(columns).astype(dtype)
+        else:
+            table = np.empty((len(lines), 0), dtype=dtype)
+        id = extract_array(string_list, start_index, n_num, n_num+1, 
+                           delimiter_char, string=True)
+        return table, id
+    
+    # identifier is the column after the outputs, may be missing on any line
+    # counting delimiters of all lines at once finds files without any
+    lookup = {'': 0}
+    if (delimiter is not None and 
+        '\n'.join(lines).count(delimiter) == len(lines)*(n_num - 1)):
+        return table, (np.zeros(len(lines), dtype=np.int32), list(lookup))
+    
+    codes = np.empty(len(lines), dtype=np.int32)
+    for i, line in enumerate(lines):
+        words = line.split(delimiter, n_num+1)
+        if len(words) > n_num:
+            codes[i] = lookup.setdefault(words[n_num].strip(), len(lookup))
+        else:
+            codes[i] = 0
+    
+    return table, (codes, list(lookup))
+
+
+def fit_interpolator(x, y, interpolator='nearest', grid=True, neighbors=None, 
+                     kernel='thin_plate_spline', smoothing=0.0, epsilon=None,
+                     tiles=None):
+    """
+    Convenience function to fit an interpolator to normalised inputs x and 
+    outputs y with the options of add_interpolator, returns the interpolator
+    and the number of rows to evaluate in one block
+    """
+    from scipy.interpolate import RBFInterpolator
+    from scipy.interpolate import LinearNDInterpolator
+    from scipy.interpolate import NearestNDInterpolator
+    
+    if grid and interpolator in ('linear', 'nearest'):
+        interp = GridInterpolator.from_scattered(x, y, interpolator)
+        if interp is not None:
+            return interp, interpolate_block_rows
+        
+    if tiles is not None and interpolator in ('linear', 'nearest'):
+        return TiledInterpolator(x, y, interpolator, tiles), interpolate_block_rows
+    
+    if interpolator == 'RBF':                
+        options = {'neighbors': neighbors, 'kernel': kernel, 'smoothing': smoothing}
+        if epsilon is not None:
+            options['epsilon'] = epsilon
+        interp = RBFInterpolator(x, y, **options)
+        # each query point is compared with every data point or neighbour
+        work = 8*(x.shape[0] if neighbors is None else neighbors)
+        return interp, max(1, min(interpolate_block_rows, interpolate_block_bytes//work))
+    elif interpolator == 'linear':
+        return LinearNDInterpolator(x, y), interpolate_block_rows
+    else:
+        # default is guaranteed to work
+        return NearestNDInterpolator(x, y), interpolate_block_rows
+
+
+# interpolator of a worker process, see AeroX.interpolate
+_worker_interp = None
+
+def _set_worker_interpolator(interp):
+    """ initializer for worker processes, keeps interpolator for all blocks """
+    global _worker_interp
+    _worker_interp = interp
+
+
+def _worker_interpolate(x):
+    """ evaluate block of inputs with interpolator of worker process """
+    return _worker_interp(x)
+
+
+def interp_nbytes(interp):
+    """
+    Convenience function to estimate the memory used by a scipy 
+    LinearNDInterpolator or NearestNDInterpolator
+    """
+    if hasattr(interp, 'tri'):
+        tri = interp.tri
+        nd = tri.points.shape[1]
+        # transform is computed when first evaluated
+        return (tri.points.nbytes + tri.simplices.nbytes + tri.neighbors.nbytes 
+                + tri.equations.nbytes + tri.nsimplex*(nd + 1)*nd*8 
+                + interp.values.nbytes)
+    # points, values and a tree with an index of the points
+    return 2*interp.points.nbytes + interp.values.nbytes
+
+
+def grid_axes(x):
+    """
+    Convenience function to test if rows of x form a full tensor product grid
+    returns the distinct values of each varying column, the varying columns
+    and the flat grid index of each row, or None if not a grid
+    """
+    nrows = x.shape[0]
+    if nrows < 2 or np.isnan(x).any():
+        return None
+    
+    axes = []; dims = []; inverse = []
+    size = 1
+    for col in range(x.shape[1]):
+        values, index = np.unique(x[:,col], return_inverse=True)
+        if values.size == 1: # constant input plays no part
+            continue
+        size = size*values.size
+        if size > nrows: # too few rows to fill the grid
+            return None
+        axes.append(values); dims.append(col); inverse.append(index)
+    
+    if not dims or size != nrows:
+        return None
+    
+    # every grid point must appear exactly once
+    flat = np.ravel_multi_index(inverse, [axis.size for axis in axes])
+    if np.any(np.bincount(flat, minlength=size) != 1):
+        return None
+    return axes, dims, flat
+
+
+def match_values(column, value, rtol=1.0e-5, atol=1.0e-8):
+    """
+    Convenience function to test a column against a Query condition
+    value is a number, np.nan, an inclusive (lower, upper) range
+    or a list of numbers, returns a boolean array
+    """
+    if isinstance(value, tuple):
+        lower, upper = range_bounds(value)
+        return np.logical_and(column >= lower, column <= upper)
+    
+    if isinstance(value, (list, set, frozenset, np.ndarray)):
+        values = np.asarray(list(value), dtype=float).ravel()
+        match = np.isnan(column) if np.isnan(values).any() else np.full(column.shape, False)
+        values = np.unique(values[np.logical_not(np.isnan(values))])
+        if values.size > 0:
+            # a match within tolerance is always one of the nearest values 
+            # on either side, so only those need testing
+            right = np.searchsorted(values, column).clip(0, values.size-1)
+            left = (right - 1).clip(0, values.size-1)
+            match = (match | np.isclose(column, values[left], rtol=rtol, atol=atol) 
+                           | np.isclose(column, values[right], rtol=rtol, atol=atol))
+        return match
+    
+    if np.isnan(value):
+        return np.isnan(column)
+    return np.isclose(column, value, rtol=rtol, atol=atol)
+
+
+def range_bounds(value):
+    """
+    Convenience function for the bounds of a (lower, upper) range
+    None is no bound
+    """
+    lower, upper = value
+    lower = -np.inf if lower is None else lower
+    upper = np.inf if upper is None else upper
+    return lower, upper
+
+
+def array_fingerprint(*arrays):
+    """
+    Convenience function to compute a hash of the shape, type and content 
+    of arrays, used to detect if data has changed
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f'{array.shape} {array.dtype.str};'.encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def cache_filename(filename):
+    """
+    Convenience function for the name of the binary cache of filename
+    """
+    return os.fspath(filename) + '.cache.npz'
+
+
+def write_cache(cachename, meta, table, id_codes, id_names):
+    """
+    Convenience function to write the binary cache of a file, to a 
+    temporary file renamed when complete so a partial cache is never seen
+    """
+    tmpname = cachename + '.tmp'
+    try:
+        with open(tmpname, 'wb') as f:
+            np.savez(f, meta=json.dumps(meta), table=table, 
+                     id_codes=id_codes, id_names=id_names)
+        os.replace(tmpname, cachename)
+    except OSError as error:
+        print(f'Warning: unable to write cache {cachename}, {error}')
+
+
+def file_hash(filename, block_size=1<<20):
+    """
+    Convenience function to compute the hash of the content of filename
+    reads in blocks so large files are not held in memory
+    """
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 def extract_strings(text, col_start, col_end, delimiter_char=',', quote_char='"'):
     """
     Convenience function to extract comma-separated strings, 
@@ -774,6 +2810,35 @@ def extract_strings(text, col_start, col_end, delimiter_char=',', quote_char='"'
     
     return cleaned
 
+def format_rows(array, sig_figs=6, delimiter_char=', '):
+    """
+    Convenience function to format rows of a 2d array as lines of text
+    gives identical results to joining format_number of every value but
+    formats the whole array with one string operation, only numbers without
+    a decimal point are then fixed up individually
+    """
+    nrows, ncols = array.shape
+    if nrows == 0:
+        return []
+    
+    values = array.ravel().tolist()
+    cells = ('\x00'.join([f'%.{sig_figs}g'] * len(values)) % tuple(values)).split('\x00')
+    cells = [cell if '.' in cell else add_decimal_place(cell) for cell in cells]
+    
+    # join cells into rows also with a single string operation
+    row_format = delimiter_char.replace('%', '%%').join(['%s'] * ncols)
+    return ('\n'.join([row_format] * nrows) % tuple(cells)).split('\n')
+
+
+def add_decimal_place(formatted):
+    """
+    Convenience function to add .0 to a formatted number without a decimal point
+    also to the mantissa if in exponential notation
+    """
+    mantissa, e, exponent = formatted.partition('e')
+    return mantissa + '.0' + e + exponent
+
+
 def format_number(num, sig_figs=6):
     """
     Convenience function to format numbers, ensures at least one decimal place
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:13:48 2026
+
+"""
+
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark appending samples one at a time as they are acquired
+# compares append_rows with stacking arrays and recomputing the statistics
+# optional argument is the number of samples, default 5000
+
+nsamples = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+rng = np.random.default_rng(0)
+samples = rng.uniform(0.0, 1.0, (nsamples, 4))
+
+def new_object():
+    data = AeroX()
+    data.insert_x('time', 'time', 's', np.array([0.0]))
+    data.insert_x('alpha', 'angle of attack', 'degrees', np.array([0.0]))
+    data.insert_y('CL', 'lift coefficient', '-', np.array([0.0]))
+    data.insert_y('CD', 'drag coefficient', '-', np.array([0.0]))
+    return data
+
+data = new_object()
+start = time.perf_counter()
+for sample in samples:
+    data.x = np.vstack((data.x, sample[:2]))
+    data.y = np.vstack((data.y, sample[2:]))
+    data._set_minmaxmean_x()
+    data._set_minmaxmean_y()
+t_stack = time.perf_counter() - start
+print(f'stack and recompute, {nsamples} samples: {t_stack:.3f} s')
+stacked = data
+
+data = new_object()
+start = time.perf_counter()
+for sample in samples:
+    data.append_rows(sample[:2], sample[2:])
+t_append = time.perf_counter() - start
+print(f'append_rows, {nsamples} samples:         {t_append:.3f} s')
+
+print('speed up:', round(t_stack/t_append, 1))
+print('same data:', np.array_equal(data.x, stacked.x), np.array_equal(data.y, stacked.y))
+print('max difference of mean:', np.max(np.abs(data.y_mean - stacked.y_mean)))
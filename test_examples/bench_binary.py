@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:34:05 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark binary AeroX files against text
+# writing, reading the whole file and reading a single column
+# optional argument is the number of rows, default 1000000
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+rng = np.random.default_rng(0)
+data = AeroX()
+data.insert_x('alpha', 'angle of attack', 'degrees', rng.uniform(-5.0, 15.0, nrows))
+data.insert_x('Re', 'Reynolds number', '-', rng.choice([1.0E6, 2.0E6], nrows))
+data.insert_x('M', 'Mach number', '-', rng.choice([0.1, 0.2, 0.4], nrows))
+data.insert_y('CD', 'drag coefficient', '-', rng.uniform(0.01, 0.1, nrows))
+data.insert_y('CL', 'lift coefficient', '-', rng.uniform(-0.5, 1.5, nrows))
+data.insert_y('CM', 'pitching moment coefficient', '-', rng.uniform(-0.1, 0.0, nrows))
+data.id_name = ['RUNID']
+data.id = np.array([[f'run{i//1000}'] for i in range(nrows)])
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+print(f'{nrows} rows')
+for name, binary in (('text', False), ('binary', True)):
+    filename = 'bench_binary.aerox' if binary else 'bench_binary.csv'
+    t_write, _ = timed(lambda: data.write(filename, binary=binary))
+    t_read, read = timed(lambda: AeroX(filename))
+    t_column, CL = timed(lambda: np.mean(AeroX(filename, lazy=True).get('CL')))
+    size = os.path.getsize(filename)/1.0E6
+    print(f'{name:>6}: {size:.1f} MB, write {t_write:.3f} s, read {t_read:.3f} s, '
+          f'mean of one column {t_column:.3f} s')
+    if binary:
+        print('binary exact:', np.array_equal(read._xy(), data._xy()), 
+              np.array_equal(read.id, data.id))
+    os.remove(filename)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:02:14 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX, cache_filename
+
+# benchmark opening a large synthetic file with and without the binary cache
+# cold open parses the text and writes the cache, warm open reads the cache
+# optional argument is the number of rows, default 500000
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+filename = 'bench_cache.csv'
+
+print(f'writing {nrows} rows to {filename}..')
+data = AeroX()
+rng = np.random.default_rng(0)
+data.insert_x('x', 'x coordinate', 'm', rng.uniform(0.0, 1.0, nrows))
+data.insert_x('y', 'y coordinate', 'm', rng.uniform(0.0, 1.0, nrows))
+data.insert_y('Cp', 'pressure coefficient', '-', rng.normal(0.0, 0.5, nrows))
+data.add_comment('synthetic surface pressure for cache benchmark')
+data.write(filename)
+
+if os.path.exists(cache_filename(filename)):
+    os.remove(cache_filename(filename))
+
+start = time.perf_counter()
+AeroX(filename)
+t_text = time.perf_counter() - start
+print(f'text open, no cache:   {t_text:.3f} s')
+
+start = time.perf_counter()
+AeroX(filename, cache=True)
+t_cold = time.perf_counter() - start
+print(f'cold open, write cache: {t_cold:.3f} s')
+
+start = time.perf_counter()
+data = AeroX(filename, cache=True)
+t_warm = time.perf_counter() - start
+print(f'warm open, read cache:  {t_warm:.3f} s')
+
+print('speed up warm over text:', round(t_text/t_warm, 1))
+print('cache size / file size:',
+      round(os.path.getsize(cache_filename(filename))/os.path.getsize(filename), 2))
+
+os.remove(filename)
+os.remove(cache_filename(filename))
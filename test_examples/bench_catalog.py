@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:48:21 2026
+
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import numpy as np
+
+from aerox import AeroX, Catalog
+
+# benchmark finding files in an archive with a catalog, against opening 
+# every file, and rescanning when only a few files have changed
+# optional argument is the number of files, default 2000
+
+nfiles = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+directory = tempfile.mkdtemp()
+rng = np.random.default_rng(0)
+alpha = np.linspace(-5.0, 15.0, 200)
+for i in range(nfiles):
+    data = AeroX()
+    data.insert_x('alpha', 'angle of attack', 'degrees', alpha)
+    data.insert_x('Re', 'Reynolds number', '-', np.full(alpha.size, rng.choice([0.5E6, 1.0E6, 2.0E6])))
+    data.insert_y('CD', 'drag coefficient', '-', 0.01 + 0.001*alpha**2)
+    if i % 2 == 0:
+        data.insert_y('CL', 'lift coefficient', '-', 0.1*alpha)
+    data.add_comment(f'synthetic polar {i}')
+    subdirectory = os.path.join(directory, f'run{i//100}')
+    os.makedirs(subdirectory, exist_ok=True)
+    data.write(os.path.join(subdirectory, f'polar{i}.csv'))
+print(f'{nfiles} files')
+
+print('open every file to find Re above 1.0E6 with CL output..')
+start = time.perf_counter()
+found = []
+for root, dirs, files in os.walk(directory):
+    for filename in files:
+        data = AeroX(os.path.join(root, filename))
+        if 'CL' in data.y_names and 'Re' in data.x_names and np.max(data.get("Re")) >= 1.0E6:
+            found.append(os.path.join(root, filename))
+print(f'  {time.perf_counter() - start:.3f} s, {len(found)} files')
+
+database = os.path.join(directory, 'catalog.sqlite')
+catalog = Catalog(database)
+for ranges in (False, True):
+    start = time.perf_counter()
+    catalog.scan(directory, ranges=ranges)
+    print(f'first scan, ranges {ranges}: {time.perf_counter() - start:.3f} s')
+
+for i in range(0, nfiles, 100): # change one file in each hundred
+    os.utime(os.path.join(directory, f'run{i//100}', f'polar{i}.csv'))
+start = time.perf_counter()
+nread = catalog.scan(directory, ranges=True)
+print(f'rescan, {nread} files changed: {time.perf_counter() - start:.3f} s')
+
+start = time.perf_counter()
+found_catalog = catalog.find(Re=(1.0E6, None), CL=None)
+print(f'find: {time.perf_counter() - start:.4f} s, {len(found_catalog)} files')
+print('same files:', sorted(found) == found_catalog)
+
+catalog.close()
+shutil.rmtree(directory)
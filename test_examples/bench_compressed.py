@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:27:48 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark reading and writing compressed files against uncompressed
+# the windsor surface pressure data is repeated to make a large file
+# optional argument is the number of repeats, default 5000
+
+repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+windsor = AeroX('windsor_surfacepressure_group4.csv')
+data = AeroX.concat([windsor]*repeats)
+# small changes so the rows are not all repeated
+rng = np.random.default_rng(0)
+data.y[:] = data.y + rng.normal(0.0, 1.0E-3, data.y.shape).round(4)
+print(f'{data.y.shape[0]} rows')
+
+cases = [('none', '.csv', None), ('gzip 1', '.csv.gz', 1), ('gzip 6', '.csv.gz', 6), 
+         ('bz2 6', '.csv.bz2', 6), ('xz 1', '.csv.xz', 1), ('xz 6', '.csv.xz', 6)]
+for name, extension, level in cases:
+    filename = 'bench_compressed' + extension
+    start = time.perf_counter()
+    data.write(filename, compresslevel=level)
+    t_write = time.perf_counter() - start
+    start = time.perf_counter()
+    read = AeroX(filename)
+    t_read = time.perf_counter() - start
+    size = os.path.getsize(filename)/1.0E6
+    if name == 'none':
+        text_size = size
+    print(f'{name:>7}: {size:6.2f} MB, {100*size/text_size:3.0f} %, write {t_write:.3f} s, '
+          f'read {t_read:.3f} s, {text_size/t_read:.0f} MB/s of text read')
+    os.remove(filename)
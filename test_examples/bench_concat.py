@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:22:10 2026
+
+"""
+
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark concatenating many datasets against stacking their arrays
+# one at a time, half the datasets have alpha in radians to be converted
+# optional arguments are the number of datasets, default 50, and the rows
+# in each, default 20000
+
+ndata = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+nrows = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+rng = np.random.default_rng(0)
+datasets = []
+for i in range(ndata):
+    data = AeroX()
+    data.insert_x('alpha', 'angle of attack', 'degrees', rng.uniform(-5.0, 15.0, nrows))
+    data.insert_x('Re', 'Reynolds number', '-', np.full(nrows, 1.0E6*(1 + i)))
+    data.insert_y('CD', 'drag coefficient', '-', rng.uniform(0.01, 0.1, nrows))
+    data.insert_y('CL', 'lift coefficient', '-', rng.uniform(-0.5, 1.5, nrows))
+    data.id_name = ['RUN']
+    data.id = np.full((nrows, 1), f'run{i}')
+    if i % 2 == 1:
+        data.convert_units('alpha', 'radian')
+    datasets.append(data)
+print(f'{ndata} datasets of {nrows} rows')
+
+start = time.perf_counter()
+x = datasets[0].x.copy(); y = datasets[0].y.copy(); id = datasets[0].id.copy()
+for data in datasets[1:]:
+    data_x = data.x.copy()
+    if data.x_units[0] == 'radian':
+        data_x[:,0] = np.degrees(data_x[:,0])
+    x = np.vstack((x, data_x)); y = np.vstack((y, data.y)); id = np.vstack((id, data.id))
+t_stack = time.perf_counter() - start
+print(f'stacking one at a time: {t_stack:.3f} s')
+
+AeroX.concat(datasets[:2]) # so creating the unit registry is not counted
+start = time.perf_counter()
+result = AeroX.concat(datasets)
+t_concat = time.perf_counter() - start
+print(f'concat:                 {t_concat:.3f} s')
+print('speed up:', round(t_stack/t_concat, 1))
+print('same data:', np.allclose(result.x, x), np.array_equal(result.y, y), np.array_equal(result.id, id))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:02:48 2026
+
+"""
+
+import sys
+import time
+import numpy as np
+import scipy.interpolate # so import time is not counted as fit time
+
+from aerox import AeroX
+
+# benchmark linear interpolation of a shuffled alpha x Re x Mach grid
+# compares the regular grid interpolator with Delaunay triangulation
+# optional argument is the number of alpha values, default 40
+
+n_alpha = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+alpha = np.linspace(-5.0, 15.0, n_alpha)
+Re = np.linspace(1.0E6, 5.0E6, 20)
+M = np.linspace(0.1, 0.8, 10)
+ag, rg, mg = [g.ravel() for g in np.meshgrid(alpha, Re, M, indexing='ij')]
+
+# shuffle rows so the grid is not in order
+rng = np.random.default_rng(0)
+order = rng.permutation(ag.size)
+ag = ag[order]; rg = rg[order]; mg = mg[order]
+
+data = AeroX()
+data.insert_x('alpha', 'angle of attack', 'degrees', ag)
+data.insert_x('Re', 'Reynolds number', '-', rg)
+data.insert_x('M', 'Mach number', '-', mg)
+data.insert_y('CL', 'lift coefficient', '-', 0.1*ag*(1.0 + 0.05*rg/1.0E6)/np.sqrt(1.0 - mg**2))
+print(f'grid of {ag.size} points')
+
+nquery = 20000
+query = np.column_stack([rng.uniform(-5.0, 15.0, nquery), rng.uniform(1.0E6, 5.0E6, nquery),
+                         rng.uniform(0.1, 0.8, nquery)])
+
+for grid in (True, False):
+    data.add_interpolator('linear', grid=grid)
+    start = time.perf_counter()
+    data.interpolate(query[:1]) # interpolator is fitted when first used
+    t_fit = time.perf_counter() - start
+    start = time.perf_counter()
+    y = data.interpolate(query)
+    t_query = time.perf_counter() - start
+    name = 'regular grid' if grid else 'Delaunay'
+    print(f'{name:>12}: fit {t_fit:.3f} s, {nquery} queries {t_query:.3f} s')
+    if grid:
+        y_grid = y
+
+print('max difference between methods:', np.nanmax(np.abs(y_grid - y)))
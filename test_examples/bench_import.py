@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 12:31:09 2026
+
+"""
+
+import sys
+import time
+import subprocess
+
+# benchmark the cost of importing aerox and constructing many objects
+# matplotlib, scipy and pint are only imported when first needed
+# and all objects share a single pint unit registry
+
+def import_time(statement, repeats=5):
+    """ best time for statement in a fresh python process """
+    code = f'import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)'
+    times = [float(subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                  text=True, check=True).stdout)
+             for _ in range(repeats)]
+    return min(times)
+
+print(f'import numpy:                 {import_time("import numpy"):.3f} s')
+print(f'import aerox:                 {import_time("import aerox"):.3f} s')
+print(f'import matplotlib.pyplot:     {import_time("import matplotlib.pyplot"):.3f} s')
+print(f'import scipy interpolators:   {import_time("import scipy.interpolate"):.3f} s')
+registry = "import pint; pint.UnitRegistry(system='SI')"
+print(f'create one pint registry:     {import_time(registry):.3f} s')
+
+from aerox import AeroX
+
+n = 1000
+start = time.perf_counter()
+for _ in range(n):
+    AeroX()
+t_empty = time.perf_counter() - start
+print(f'construct empty object:       {1.0E6*t_empty/n:.1f} us')
+
+n = 200
+start = time.perf_counter()
+for _ in range(n):
+    AeroX('polar.csv')
+t_read = time.perf_counter() - start
+print(f'construct from polar.csv:     {1.0E6*t_read/n:.1f} us')
+
+start = time.perf_counter()
+data = AeroX('units.csv')
+data.check_units()
+print(f'first unit check, registry:   {time.perf_counter() - start:.3f} s')
+
+start = time.perf_counter()
+data = AeroX('units.csv')
+data.check_units()
+print(f'second unit check, shared:    {time.perf_counter() - start:.3f} s')
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:21:40 2026
+
+"""
+
+import sys
+import time
+import numpy as np
+import scipy.interpolate # so import time is not counted as fit time
+
+from aerox import AeroX
+
+# benchmark interpolate_y called once per point, as in a trim loop, against 
+# a single call with an array of inputs
+# optional argument is the number of points, default 10000
+
+npoints = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+rng = np.random.default_rng(0)
+alpha = rng.uniform(-5.0, 15.0, 2000)
+M = rng.uniform(0.1, 0.8, 2000)
+data = AeroX()
+data.insert_x('alpha', 'angle of attack', 'degrees', alpha)
+data.insert_x('M', 'Mach number', '-', M)
+data.insert_y('CD', 'drag coefficient', '-', 0.01 + 0.001*alpha**2)
+data.insert_y('CL', 'lift coefficient', '-', 0.1*alpha/np.sqrt(1.0 - M**2))
+data.insert_y('CM', 'pitching moment coefficient', '-', -0.01*alpha)
+data.add_interpolator('RBF', neighbors=20)
+
+alpha = np.linspace(-4.0, 14.0, npoints)
+data.interpolate_y('CL', alpha=0.0, M=0.5) # fit before timing
+
+start = time.perf_counter()
+CL_loop = np.array([data.interpolate_y('CL', alpha=a, M=0.5) for a in alpha])
+t_loop = time.perf_counter() - start
+print(f'{npoints} calls with single values: {t_loop:.3f} s')
+
+start = time.perf_counter()
+CL_array = data.interpolate_y('CL', alpha=alpha, M=0.5)
+t_array = time.perf_counter() - start
+print(f'one call with an array:         {t_array:.3f} s')
+
+print('speed up:', round(t_loop/t_array, 1))
+print('max difference:', np.max(np.abs(CL_loop - CL_array)))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:31:12 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark reading the names and units of a file, opening it in full 
+# against opening the header only with lazy=True
+# optional argument is the number of rows in the file, default 10000
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+rng = np.random.default_rng(0)
+data = AeroX()
+data.insert_x('alpha', 'angle of attack', 'degrees', rng.uniform(-5.0, 15.0, nrows))
+data.insert_x('Re', 'Reynolds number', '-', rng.choice([1.0E6, 2.0E6], nrows))
+data.insert_y('CD', 'drag coefficient', '-', rng.uniform(0.01, 0.1, nrows))
+data.insert_y('CL', 'lift coefficient', '-', rng.uniform(-0.5, 1.5, nrows))
+data.write('bench_lazy.csv')
+
+for lazy in (False, True):
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 1.0:
+        data = AeroX('bench_lazy.csv', lazy=lazy)
+        names = data.x_names + data.y_names
+        n = n + 1
+    rate = n/(time.perf_counter() - start)
+    print(f'names of {nrows} row file, lazy {lazy}: {rate:.0f} files per second')
+
+start = time.perf_counter()
+data.x_max # read data of last lazy object
+print(f'reading data when first used: {time.perf_counter() - start:.3f} s')
+
+os.remove('bench_lazy.csv')
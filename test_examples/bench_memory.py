@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:58:34 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark memory used by a large file read as float64 and float32
+# identifiers are stored once as names with a code per row
+# compared with the same identifiers held as a numpy string array
+# optional argument is the number of rows, default 200000
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+rng = np.random.default_rng(0)
+data = AeroX()
+data.insert_x('alpha', 'angle of attack', 'degrees', rng.uniform(-5.0, 15.0, nrows))
+data.insert_x('Re', 'Reynolds number', '-', rng.choice([1.0E6, 2.0E6], nrows))
+data.insert_x('M', 'Mach number', '-', rng.choice([0.1, 0.2, 0.4], nrows))
+data.insert_y('CD', 'drag coefficient', '-', rng.uniform(0.01, 0.1, nrows))
+data.insert_y('CL', 'lift coefficient', '-', rng.uniform(-0.5, 1.5, nrows))
+data.insert_y('CM', 'pitching moment coefficient', '-', rng.uniform(-0.1, 0.0, nrows))
+# a run identifier shared by blocks of rows
+data.id_name = ['RUNID']
+data.id = np.array([[f'tunnel run {i//100:05d}'] for i in range(nrows)])
+data.write('bench_memory.csv')
+
+for dtype in (np.float64, np.float32):
+    start = time.perf_counter()
+    data = AeroX('bench_memory.csv', dtype=dtype)
+    t_read = time.perf_counter() - start
+    table = data._table.nbytes
+    codes = data._id_codes.nbytes + sum(len(name) for name in data._id_names)
+    strings = data.id.nbytes
+    print(f'{np.dtype(dtype).name}: read {t_read:.3f} s, table {table/1.0E6:.1f} MB, '
+          f'identifiers {codes/1.0E6:.2f} MB as codes, {strings/1.0E6:.1f} MB as strings')
+
+print('max difference float32 against float64 CL:', 
+      np.max(np.abs(AeroX('bench_memory.csv').get('CL') - data.get('CL'))))
+
+os.remove('bench_memory.csv')
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:52:06 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import scipy.interpolate # so import time is not counted as fit time
+
+from aerox import AeroX
+
+# benchmark interpolate on a pool of threads or processes
+# local RBF of a scattered surface pressure like field, as for a high 
+# resolution contour plot
+# optional arguments are the number of query points, default 200000, and the
+# maximum number of workers, default the number of cores up to 32
+
+nquery = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else min(os.cpu_count(), 32)
+
+def field(y, z):
+    return -0.3 + 0.1*np.sin(3.0*y)*np.cos(2.0*z) + 0.05*y*z
+
+rng = np.random.default_rng(0)
+y = rng.uniform(-1.0, 1.0, 5000)
+z = rng.uniform(-1.0, 1.0, 5000)
+
+data = AeroX()
+data.insert_x('y', 'y coordinate', 'm', y)
+data.insert_x('z', 'z coordinate', 'm', z)
+data.insert_y('Cp', 'pressure coefficient', '-', field(y, z))
+data.add_interpolator('RBF', neighbors=30)
+
+query = rng.uniform(-0.9, 0.9, (nquery, 2))
+Cp = data.interpolate(query, workers=1)
+
+print(f'{nquery} query points, {os.cpu_count()} cores')
+start = time.perf_counter()
+data.interpolate(query, workers=1)
+t_serial = time.perf_counter() - start
+print(f'  serial:      {t_serial:.3f} s')
+
+workers = 1
+while workers < max_workers:
+    workers = 2*workers
+    for processes in (False, True):
+        start = time.perf_counter()
+        Cp_parallel = data.interpolate(query, workers=workers, processes=processes)
+        t_parallel = time.perf_counter() - start
+        name = 'processes' if processes else 'threads'
+        print(f'  {workers:2d} {name:>9}: {t_parallel:.3f} s, speed up {t_serial/t_parallel:.1f},',
+              f'max difference {np.max(np.abs(Cp - Cp_parallel)):.1e}')
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:25:31 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import scipy.interpolate # so import time is not counted as fit time
+
+from aerox import AeroX
+
+# benchmark fitting a linear interpolator to scattered data against
+# reloading the saved interpolator, as a new process would do
+# optional argument is the number of data points, default 300000
+
+npoints = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+filename = 'bench_persist.interp'
+
+rng = np.random.default_rng(0)
+data = AeroX()
+data.insert_x('alpha', 'angle of attack', 'degrees', rng.uniform(-5.0, 15.0, npoints))
+data.insert_x('M', 'Mach number', '-', rng.uniform(0.1, 0.8, npoints))
+data.insert_y('CL', 'lift coefficient', '-', 0.1*data.get('alpha')/np.sqrt(1.0 - data.get('M')**2))
+
+query = np.column_stack([rng.uniform(-5.0, 15.0, 1000), rng.uniform(0.1, 0.8, 1000)])
+
+print(f'fit linear interpolator to {npoints} scattered points and save..')
+start = time.perf_counter()
+data.add_interpolator('linear', filename=filename)
+print(f'  {time.perf_counter() - start:.3f} s, file size {os.path.getsize(filename)/1.0E6:.1f} MB')
+y_fit = data.interpolate(query)
+
+print('load saved interpolator..')
+start = time.perf_counter()
+data.add_interpolator('linear', filename=filename)
+print(f'  {time.perf_counter() - start:.3f} s')
+print('identical results:', np.array_equal(y_fit, data.interpolate(query), equal_nan=True))
+
+print('changed data is refitted..')
+data.insert_y('CD', 'drag coefficient', '-', np.full(npoints, 0.02))
+data.add_interpolator('linear', filename=filename)
+
+os.remove(filename)
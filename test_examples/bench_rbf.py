@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:40:12 2026
+
+"""
+
+import sys
+import time
+import numpy as np
+import scipy.interpolate # so import time is not counted as fit time
+
+from aerox import AeroX
+
+# benchmark global RBF against local RBF using nearest neighbours
+# scattered samples of an analytical surface pressure like field
+# accuracy is the RMS error against the exact function at random points
+# optional argument is the number of data points, default 3000
+
+npoints = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+
+def field(y, z):
+    return -0.3 + 0.1*np.sin(3.0*y)*np.cos(2.0*z) + 0.05*y*z
+
+rng = np.random.default_rng(0)
+y = rng.uniform(-1.0, 1.0, npoints)
+z = rng.uniform(-1.0, 1.0, npoints)
+
+data = AeroX()
+data.insert_x('y', 'y coordinate', 'm', y)
+data.insert_x('z', 'z coordinate', 'm', z)
+data.insert_y('Cp', 'pressure coefficient', '-', field(y, z))
+
+nquery = 20000
+query = rng.uniform(-0.9, 0.9, (nquery, 2))
+exact = field(query[:,0], query[:,1])
+
+cases = [('global', {}),
+         ('local 20', {'neighbors': 20}),
+         ('local 50', {'neighbors': 50}),
+         ('local 50 cubic', {'neighbors': 50, 'kernel': 'cubic'}),
+         ('local 50 smoothed', {'neighbors': 50, 'smoothing': 1.0E-6})]
+
+print(f'{npoints} data points, {nquery} query points')
+for name, options in cases:
+    if name == 'global' and npoints > 10000:
+        print(f'{name:>18}: skipped, too many points')
+        continue
+    data.add_interpolator('RBF', **options)
+    start = time.perf_counter()
+    data.interpolate(query[:1]) # interpolator is fitted when first used
+    t_fit = time.perf_counter() - start
+    start = time.perf_counter()
+    Cp = data.interpolate(query)[:,0]
+    t_query = time.perf_counter() - start
+    rms = np.sqrt(np.mean((Cp - exact)**2))
+    print(f'{name:>18}: fit {t_fit:.3f} s, query {t_query:.3f} s, RMS error {rms:.2e}')
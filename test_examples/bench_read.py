@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:40 2026
+
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+from aerox import AeroX, extract_array
+
+# benchmark reading a large synthetic polar file
+# compares the single pass body parser with the original per line extraction
+# optional argument is the number of rows, default 200000
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+filename = 'bench_read.csv'
+
+print(f'writing {nrows} rows to {filename}..')
+rng = np.random.default_rng(0)
+alpha = rng.uniform(-5.0, 15.0, nrows)
+Re = rng.choice([1.0E6, 2.0E6, 3.0E6], nrows)
+CD = 0.01 + 0.001*alpha**2
+CL = 0.1*alpha
+with open(filename, 'w') as f:
+    f.write('# synthetic polar for read benchmark\n')
+    f.write('2, 2\n')
+    f.write('angle of attack, Reynolds number, drag coefficient, lift coefficient\n')
+    f.write('degrees, -, -, -\n')
+    f.write('alpha, Re, CD, CL, RUNID\n')
+    for i in range(nrows):
+        line = f'{alpha[i]:.6g}, {Re[i]:.6g}, {CD[i]:.6g}, {CL[i]:.6g}'
+        if i % 3 == 0: # sparse identifier
+            line += f', run{i}'
+        f.write(line+'\n')
+
+print('original per line extraction..')
+start = time.perf_counter()
+data = AeroX()
+body = data._read(filename)
+x = extract_array(body, 4, 0, 2)
+y = extract_array(body, 4, 2, 4)
+ids = extract_array(body, 4, 4, 5, string=True)
+t_old = time.perf_counter() - start
+print(f'  {t_old:.3f} s')
+
+print('single pass body parser..')
+start = time.perf_counter()
+data = AeroX(filename)
+t_new = time.perf_counter() - start
+print(f'  {t_new:.3f} s')
+
+print('speed up:', round(t_old/t_new, 1))
+print('same x:', np.array_equal(x, data.x),
+      'same y:', np.array_equal(y, data.y),
+      'same id:', np.array_equal(ids, data.id))
+
+os.remove(filename)
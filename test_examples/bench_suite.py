@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:58:16 2026
+
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import platform
+import warnings
+import datetime
+import subprocess
+import tracemalloc
+import numpy as np
+import matplotlib
+matplotlib.use('Agg') # headless, figures are drawn but never shown
+import matplotlib.pyplot as plt
+import scipy.interpolate # so import time is not counted as fit time
+
+import aerox
+from aerox import AeroX
+
+# benchmark suite timing the main operations on synthetic datasets
+# of 1000 rows up to 10 million rows, in three shapes
+#   polar grid        alpha x Re x Mach grid with drag, lift and moment
+#   scattered surface random points on a surface with pressure coefficient
+#   PIV field         regular grid of points with three velocity components
+# each operation is timed, then run again tracing memory for the peak
+# results are written to JSON, and compared with an earlier results file
+# optional arguments are the largest number of rows, default 100000,
+# the results file, default bench_suite.json, and earlier results to compare
+
+max_rows = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100000
+output = sys.argv[2] if len(sys.argv) > 2 else 'bench_suite.json'
+baseline = sys.argv[3] if len(sys.argv) > 3 else None
+
+sizes = [n for n in (1000, 10000, 100000, 1000000, 10000000) if n <= max_rows]
+nquery = 10000
+
+# largest datasets for slow operations, larger ones are skipped
+fit_max_rows = {'nearest': None, 'linear': 1000000, 'RBF': 1000000}
+plot_max_rows = 100000
+
+# plt.show does nothing without a display
+warnings.filterwarnings('ignore', message='.*non-interactive.*')
+
+
+def polar_grid(nrows, rng):
+    """ full grid of alpha, Re and Mach with about nrows rows, in random order """
+    alpha = np.linspace(-5.0, 15.0, max(nrows//100, 2))
+    Re = np.linspace(1.0E6, 5.0E6, 10)
+    M = np.linspace(0.1, 0.55, 10)
+    ag, rg, mg = [g.ravel() for g in np.meshgrid(alpha, Re, M, indexing='ij')]
+    order = rng.permutation(ag.size)
+    ag = ag[order]; rg = rg[order]; mg = mg[order]
+
+    data = AeroX()
+    data.add_comment('synthetic polar grid')
+    data.insert_x('alpha', 'angle of attack', 'degrees', ag)
+    data.insert_x('Re', 'Reynolds number', '-', rg)
+    data.insert_x('M', 'Mach number', '-', mg)
+    CL = 0.1*ag/np.sqrt(1.0 - mg**2)
+    data.insert_y('CD', 'drag coefficient', '-', 0.01 + 0.05*CL**2 + 0.002*rg/1.0E6)
+    data.insert_y('CL', 'lift coefficient', '-', CL)
+    data.insert_y('CM', 'pitching moment coefficient', '-', -0.02*CL)
+    data.id_name = ['RUNID']
+    data.id = np.array([f'run{i}' for i in order//1000]).reshape(-1, 1)
+    return data, ('alpha', 'Re', 'CL', {'M': 0.1})
+
+
+def scattered_surface(nrows, rng):
+    """ nrows random points on a surface with a pressure like field """
+    y = rng.uniform(-1.0, 1.0, nrows)
+    z = rng.uniform(-1.0, 1.0, nrows)
+
+    data = AeroX()
+    data.add_comment('synthetic scattered surface pressure')
+    data.insert_x('y', 'y coordinate', 'm', y)
+    data.insert_x('z', 'z coordinate', 'm', z)
+    data.insert_y('Cp', 'pressure coefficient', '-',
+                  -0.3 + 0.1*np.sin(3.0*y)*np.cos(2.0*z) + 0.05*y*z)
+    return data, ('y', 'z', 'Cp', {})
+
+
+def piv_field(nrows, rng):
+    """ regular grid of about nrows points with three velocity components """
+    side = max(int(np.sqrt(nrows)), 2)
+    xg, yg = [g.ravel() for g in np.meshgrid(np.linspace(0.0, 0.2, side),
+                                             np.linspace(-0.1, 0.1, side), indexing='ij')]
+    noise = rng.normal(0.0, 0.1, (xg.size, 3))
+
+    data = AeroX()
+    data.add_comment('synthetic PIV field')
+    data.insert_x('x', 'x coordinate', 'm', xg)
+    data.insert_x('y', 'y coordinate', 'm', yg)
+    data.insert_y('u', 'streamwise velocity', 'm/s', 30.0*(1.0 - np.exp(-(yg/0.02)**2)) + noise[:,0])
+    data.insert_y('v', 'vertical velocity', 'm/s', np.sin(50.0*xg) + noise[:,1])
+    data.insert_y('w', 'spanwise velocity', 'm/s', noise[:,2])
+    return data, ('x', 'y', 'u', {})
+
+
+def measure(function, setup=None):
+    """
+    time function, then run it again tracing memory,
+    setup is called before each run and its result passed to function,
+    returns seconds and peak memory in bytes
+    """
+    state = setup() if setup else None
+    gc.collect()
+    start = time.perf_counter()
+    function(state)
+    seconds = time.perf_counter() - start
+
+    state = setup() if setup else None
+    gc.collect()
+    tracemalloc.start()
+    function(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def draw_2d(data, x1name, x2name, yname, kwargs):
+    """ contour plot drawn in memory """
+    data.plot_2d(x1name, x2name, yname, **kwargs)
+    plt.gcf().canvas.draw()
+    plt.close('all')
+
+
+def git_commit():
+    """ commit of the source being measured, None if unknown """
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(aerox.__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+results = []
+
+def run(dataset, nrows, operation, function, setup=None):
+    """
+    measure function and store the result, an operation that fails is 
+    stored with its error, such as local RBF on points in a line,
+    returns True if it succeeded
+    """
+    result = {'dataset': dataset, 'rows': nrows, 'operation': operation}
+    try:
+        seconds, peak = measure(function, setup)
+    except Exception as error:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        result['error'] = f'{type(error).__name__}: {error}'
+        results.append(result)
+        print(f'{dataset:>17} {nrows:>9} {operation:>22}: failed, {result["error"][:60]}')
+        return False
+    result['seconds'] = seconds; result['peak_MB'] = peak/1.0E6
+    results.append(result)
+    print(f'{dataset:>17} {nrows:>9} {operation:>22}: {seconds:9.4f} s {peak/1.0E6:9.1f} MB')
+    return True
+
+
+filename = 'bench_suite.csv'
+simple_filename = 'bench_suite_simple.csv'
+
+for name, make in (('polar grid', polar_grid), ('scattered surface', scattered_surface),
+                   ('PIV field', piv_field)):
+    for size in sizes:
+        rng = np.random.default_rng(0)
+        data, (x1name, x2name, yname, plot_kwargs) = make(size, rng)
+        nrows = data.y.shape[0]
+        query = rng.uniform(data.x_min, data.x_max, (nquery, data.x_nd))
+
+        run(name, nrows, 'write', lambda state: data.write(filename))
+        run(name, nrows, '__init__', lambda state: AeroX(filename))
+
+        data.write(simple_filename, simple_CSV=True)
+        run(name, nrows, 'import_simpleCSV', 
+            lambda state: AeroX().import_simpleCSV(simple_filename, data.x_nd, data.y_nd))
+
+        # keep the middle half of the range of the first input
+        lower = 0.75*data.x_min[0] + 0.25*data.x_max[0]
+        upper = 0.25*data.x_min[0] + 0.75*data.x_max[0]
+        run(name, nrows, 'filter_keep', 
+            lambda copy: copy.filter_keep(**{data.x_names[0]: (lower, upper)}),
+            lambda: AeroX.concat([data]))
+
+        for method, options in (('nearest', {}), ('linear', {}), ('RBF', {'neighbors': 50})):
+            limit = fit_max_rows[method]
+            if limit is not None and nrows > limit:
+                continue
+
+            # interpolators are fitted when first used
+            def fit(copy):
+                copy.add_interpolator(method, **options)
+                copy.interpolate(query[:1])
+            if not run(name, nrows, f'add_interpolator {method}', 
+                       fit, lambda: AeroX.concat([data])):
+                continue
+
+            fitted = AeroX.concat([data])
+            fit(fitted)
+            run(name, nrows, f'interpolate {method}', lambda state: fitted.interpolate(query))
+            del fitted
+
+        if nrows <= plot_max_rows:
+            run(name, nrows, 'plot_2d', 
+                lambda state: draw_2d(data, x1name, x2name, yname, plot_kwargs))
+
+os.remove(filename)
+os.remove(simple_filename)
+
+report = {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+          'commit': git_commit(), 'python': platform.python_version(),
+          'numpy': np.__version__, 'platform': platform.platform(),
+          'processor': platform.processor(), 'cpus': os.cpu_count(),
+          'max_rows': max_rows, 'query_points': nquery, 'results': results}
+with open(output, 'w') as f:
+    json.dump(report, f, indent=1)
+print(f'results written to {output}')
+
+if baseline is not None:
+    with open(baseline) as f:
+        earlier = json.load(f)
+    print(f"compared with {baseline}, commit {earlier['commit']} of {earlier['date']}")
+    times = {(r['dataset'], r['rows'], r['operation']): r.get('seconds') 
+             for r in earlier['results']}
+    times = {key: seconds for key, seconds in times.items() if seconds is not None}
+    for r in results:
+        before = times.get((r['dataset'], r['rows'], r['operation']))
+        if before is None or 'seconds' not in r:
+            continue
+        ratio = r['seconds']/before
+        # very short times are too noisy to flag
+        flag = 'slower' if ratio > 1.25 and r['seconds'] > 0.01 else ''
+        print(f"{r['dataset']:>17} {r['rows']:>9} {r['operation']:>22}: {ratio:5.2f} x {flag}")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:34:50 2026
+
+"""
+
+import sys
+import time
+import numpy as np
+import scipy.interpolate # so import time is not counted as fit time
+
+import aerox
+from aerox import AeroX
+
+# benchmark linear interpolation of a large scattered field such as PIV 
+# data, one global triangulation against tiles fitted when first used
+# queries in a small region only fit the tiles they touch, a query of the 
+# whole field fits all the tiles
+# optional argument is the number of data points, default 1000000
+
+npoints = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+def field(y, z):
+    return np.sin(3.0*y)*np.cos(2.0*z) + 0.5*y*z
+
+rng = np.random.default_rng(0)
+y = rng.uniform(-1.0, 1.0, npoints)
+z = rng.uniform(-1.0, 1.0, npoints)
+
+data = AeroX()
+data.insert_x('y', 'y coordinate', 'm', y)
+data.insert_x('z', 'z coordinate', 'm', z)
+data.insert_y('u', 'velocity', 'm/s', field(y, z))
+
+nquery = 20000
+region = rng.uniform(0.2, 0.4, (nquery, 2))
+everywhere = rng.uniform(-1.0, 1.0, (nquery, 2))
+
+print(f'{npoints} data points, {nquery} query points')
+for tiles in (None, 16):
+    data.add_interpolator('linear', tiles=tiles)
+    start = time.perf_counter()
+    u_region = data.interpolate(region)
+    t_region = time.perf_counter() - start
+    start = time.perf_counter()
+    u_everywhere = data.interpolate(everywhere)
+    t_everywhere = time.perf_counter() - start
+    if tiles is None:
+        name = 'global'
+        u_global = u_everywhere
+        interp, _ = data._interpolator()
+        print(f'  global triangulation using {aerox.interp_nbytes(interp)/1.0E6:.0f} MB')
+    else:
+        name = f'{tiles}x{tiles} tiles'
+        interp, _ = data._interpolator()
+        print('  tiles kept:', len(interp._tiles), f'using {interp._nbytes/1.0E6:.0f} MB',
+              f'of {aerox.tile_cache_bytes/1.0E6:.0f} MB')
+    print(f'{name:>12}: small region {t_region:.3f} s, whole field {t_everywhere:.3f} s',
+          '(including fitting)')
+
+print('max difference tiles against global:', np.nanmax(np.abs(u_everywhere - u_global)))
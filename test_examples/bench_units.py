@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:46:52 2026
+
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import numpy as np
+
+import aerox
+from aerox import AeroX, Catalog
+
+# benchmark converting an imperial tunnel file to SI
+# one column at a time with convert_units against one pass with convert_all_units
+# then checking the units of every file in a catalog
+# optional arguments are the number of rows and number of files, default 100000 and 200
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+nfiles = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+rng = np.random.default_rng(0)
+data = AeroX()
+columns = [('V', 'tunnel speed', 'fps'), ('T', 'total temperature', 'degF'), 
+           ('p0', 'total pressure', 'psi'), ('rho', 'density', 'slug/(ft**3)'),
+           ('x', 'probe position', 'inches')]
+for name, longname, unit in columns:
+    data.insert_x(name, longname, unit, rng.uniform(1.0, 100.0, nrows))
+for name, longname, unit in columns:
+    data.insert_y(name+'_probe', longname, unit, rng.uniform(1.0, 100.0, nrows))
+targets = {'fps': 'm/s', 'degF': 'K', 'psi': 'Pa', 'slug/(ft**3)': 'kg/m**3', 'inches': 'm'}
+
+aerox.unit_registry() # so creating the registry is not counted
+single = AeroX.concat([data])
+start = time.perf_counter()
+for name, unit in zip(single.x_names + single.y_names, single.x_units + single.y_units):
+    single.convert_units(name, targets[unit])
+t_single = time.perf_counter() - start
+print(f'{nrows} rows, {len(targets)*2} columns, one at a time: {t_single:.3f} s')
+
+start = time.perf_counter()
+data.convert_all_units(system='SI')
+t_all = time.perf_counter() - start
+print(f'all columns to SI in one pass:                {t_all:.3f} s')
+print('max relative difference:', np.max(np.abs(data._xy()/single._xy() - 1.0)))
+
+directory = tempfile.mkdtemp()
+small = AeroX.concat([data])
+small.filter_keep(V=(None, 2.0))
+for i in range(nfiles):
+    small.write(os.path.join(directory, f'run{i:04d}.csv'))
+catalog = Catalog(os.path.join(directory, 'catalog.sqlite'))
+catalog.scan(directory)
+
+aerox.valid_unit.cache_clear()
+start = time.perf_counter()
+for i in range(nfiles):
+    AeroX(os.path.join(directory, f'run{i:04d}.csv'), lazy=True).check_units()
+t_files = time.perf_counter() - start
+print(f'open and check units of {nfiles} files:        {t_files:.3f} s')
+
+aerox.valid_unit.cache_clear()
+start = time.perf_counter()
+invalid = catalog.check_units()
+t_catalog = time.perf_counter() - start
+print(f'check units of the catalog:                   {t_catalog:.3f} s, {len(invalid)} not known')
+
+catalog.close()
+shutil.rmtree(directory)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:48:37 2026
+
+"""
+
+import os
+import sys
+import time
+import filecmp
+import numpy as np
+
+from aerox import AeroX, format_number
+
+# benchmark writing a large synthetic file
+# compares the block writer with formatting every number with format_number
+# optional argument is the number of rows, default 300000
+
+nrows = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+
+data = AeroX()
+rng = np.random.default_rng(0)
+data.insert_x('alpha', 'angle of attack', 'degrees', rng.integers(-5, 15, nrows).astype(float))
+data.insert_x('Re', 'Reynolds number', '-', rng.choice([1.0E6, 2.0E6, 3.0E6], nrows))
+data.insert_y('CD', 'drag coefficient', '-', rng.uniform(0.01, 0.1, nrows))
+data.insert_y('CL', 'lift coefficient', '-', rng.normal(0.5, 0.2, nrows))
+# sparse identifier
+data.id_name = ['RUNID']
+data.id = np.array([[f'run{i}' if i % 5 == 0 else ''] for i in range(nrows)])
+
+print(f'original per number formatting of {nrows} rows..')
+start = time.perf_counter()
+with open('bench_write_old.csv', 'w') as f:
+    f.write(', '.join(data.x_names + data.y_names + data.id_name)+'\n')
+    xy = np.column_stack((data.x, data.y))
+    for i, row in enumerate(xy):
+        line = ', '.join([format_number(num) for num in row])
+        if data.id[i]:
+            line += ', ' + str(data.id[i,0])
+        f.write(line+'\n')
+t_old = time.perf_counter() - start
+print(f'  {t_old:.3f} s')
+
+print('block writer..')
+start = time.perf_counter()
+data.write('bench_write_new.csv', simple_CSV=True)
+t_new = time.perf_counter() - start
+print(f'  {t_new:.3f} s')
+
+print('speed up:', round(t_old/t_new, 1))
+print('identical files:', filecmp.cmp('bench_write_old.csv', 'bench_write_new.csv', shallow=False))
+
+os.remove('bench_write_old.csv')
+os.remove('bench_write_new.csv')
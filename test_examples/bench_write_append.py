@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:02:37 2026
+
+"""
+
+import os
+import sys
+import time
+import filecmp
+import numpy as np
+
+from aerox import AeroX
+
+# benchmark logging samples to a file that is flushed every 1000 samples
+# compares rewriting the whole file with appending only the new rows
+# optional argument is the number of flushes, default 100
+
+nflush = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+block = 1000
+
+rng = np.random.default_rng(0)
+samples = rng.uniform(0.0, 1.0, (nflush*block, 4))
+
+for append in (False, True):
+    filename = f'bench_write_append_{append}.csv'
+    if os.path.exists(filename):
+        os.remove(filename)
+    data = AeroX()
+    data.insert_x('time', 'time', 's', samples[:block,0])
+    data.insert_x('alpha', 'angle of attack', 'degrees', samples[:block,1])
+    data.insert_y('CL', 'lift coefficient', '-', samples[:block,2])
+    data.insert_y('CD', 'drag coefficient', '-', samples[:block,3])
+    
+    written = 0
+    start = time.perf_counter()
+    for i in range(nflush):
+        if i > 0:
+            data.append_rows(samples[i*block:(i+1)*block,:2], samples[i*block:(i+1)*block,2:])
+        if append:
+            written = written + data.write_append(filename, start=written)
+        else:
+            data.write(filename)
+    t = time.perf_counter() - start
+    print(f'{nflush} flushes of {block} rows, append {append}: {t:.3f} s')
+
+print('identical files:', filecmp.cmp('bench_write_append_False.csv', 
+                                      'bench_write_append_True.csv', shallow=False))
+os.remove('bench_write_append_False.csv')
+os.remove('bench_write_append_True.csv')
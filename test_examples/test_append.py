@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:55:29 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+
+# test appending rows one at a time as during a tunnel run
+# statistics are updated from the new rows and should match the full file
+
+polar = AeroX('polar.csv')
+
+print('starting with Re=1.0E6, appending Re=2.0E6 a row at a time..')
+live = AeroX('polar.csv'); live.filter_keep(Re=1.0E6)
+for x, y, id in zip(polar.x[6:], polar.y[6:], polar.id[6:,0]):
+    live.append_rows(x, y, id)
+print('rows:', live.y.shape[0])
+print('same as polar:', np.array_equal(live.x, polar.x), np.array_equal(live.y, polar.y),
+      np.array_equal(live.id, polar.id))
+print('min max x:', live.x_min, live.x_max)
+print('mean y close:', np.allclose(live.y_mean, polar.y_mean))
+
+print('appending a block of rows with new identifiers..')
+live.append_rows([[1.0, 1.5E6], [2.0, 1.5E6]], [[0.02, 0.1], [0.03, 0.2]], ['extra1', 'extra2'])
+print('last identifiers:', live.id[-3:,0])
+
+print('interpolator refitted after append..')
+live.add_interpolator('linear', grid=False)
+print('CL:', live.interpolate_y('CL', alpha=1.0, Re=1.5E6))
+live.append_rows([1.0, 1.2E6], [0.02, 0.5])
+print('CL:', live.interpolate_y('CL', alpha=1.0, Re=1.2E6))
+
+print('replacing y and id between appends..')
+live.y = live.y*2.0
+live.append_rows([2.0, 1.2E6], [0.03, 0.6])
+print('doubled y kept:', np.allclose(live.y[:-1,0], 2.0*np.r_[polar.y[:,0], 0.02, 0.03, 0.02]),
+      'y max:', live.y_max)
+ids = live.id.copy(); ids[0,0] = 'first'
+live.id = ids
+live.append_rows([3.0, 1.2E6], [0.04, 0.7], 'last')
+print('identifiers kept:', live.id[0,0], live.id[-1,0])
+
+print('appending to a new object..')
+acquired = AeroX()
+acquired.insert_x('time', 'time', 's', np.array([0.0]))
+acquired.insert_y('p', 'pressure', 'Pa', np.array([101325.0]))
+for i in range(1, 100):
+    acquired.append_rows([0.01*i], [101325.0 + i])
+print('rows:', acquired.y.shape[0], 'mean p:', acquired.y_mean)
+acquired.filter_remove(time=0.0)
+print('rows after filter:', acquired.y.shape[0])
+
+print('test_append success')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:12:38 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+
+# test writing and reading binary AeroX files
+# the round trip is exact and writing back to CSV gives the same file
+
+print('write polar3 as binary and read back..')
+polar3 = AeroX('polar3.csv')
+polar3.write('out_binary.aerox', binary=True)
+binary = AeroX('out_binary.aerox')
+print('names:', binary.x_names, binary.y_names, binary.id_name)
+print('units:', binary.x_units, binary.y_units)
+print('comments:', len(binary.comments))
+print('same data:', np.array_equal(binary.x, polar3.x, equal_nan=True), 
+      np.array_equal(binary.y, polar3.y, equal_nan=True), 
+      np.array_equal(binary.id, polar3.id))
+
+print('write back to CSV..')
+polar3.write('out_binary_text.csv')
+binary.write('out_binary_roundtrip.csv')
+print('same CSV:', open('out_binary_text.csv').read() == open('out_binary_roundtrip.csv').read())
+
+print('one column of a lazy binary object is memory mapped..')
+lazy = AeroX('out_binary.aerox', lazy=True)
+CL = lazy.get('CL')
+print('CL:', type(CL).__name__, np.array_equal(CL, polar3.get('CL')))
+print('min max x:', lazy.x_min, lazy.x_max)
+
+print('read in blocks of rows..')
+for chunk in AeroX.iter_chunks('out_binary.aerox', rows=10):
+    print('rows:', chunk.y.shape[0], 'running max CL:', chunk.y_running.max[1])
+
+print('float32 data without identifiers..')
+polar = AeroX('polar.csv', dtype=np.float32)
+polar.id = np.array([])
+polar.write('out_binary32.aerox', binary=True)
+binary32 = AeroX('out_binary32.aerox', dtype=np.float32)
+print('dtype:', binary32.y.dtype, 'same:', np.array_equal(binary32.y, polar.y), 
+      'id:', binary32.id.shape)
+
+print('test_binary success')
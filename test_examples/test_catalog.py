@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:26:03 2026
+
+"""
+
+import os
+from aerox import AeroX, Catalog
+
+# test catalog of the files in this directory, found by header information
+# test rescanning only reads new or changed files
+
+catalog = Catalog('out_catalog.sqlite')
+
+print('scanning directory with ranges..')
+print('files read:', catalog.scan('.', ranges=True))
+print('rescan, files read:', catalog.scan('.', ranges=True))
+
+def names(paths):
+    return [os.path.basename(path) for path in paths]
+
+print('Re above 1.5E6 with CL output:', names(catalog.find(Re=(1.5E6, None), CL=None)))
+print('alpha includes 5:', names(catalog.find(alpha=5.0)))
+print('unit Pa:', names(catalog.find(unit='Pa')))
+print('comment aerofoil:', names(catalog.find(comment='AEROFOIL')))
+
+print('adding a file..')
+polar = AeroX('polar.csv')
+polar.filter_keep(Re=2.0E6)
+polar.write('out_catalog_polar.csv')
+print('rescan, files read:', catalog.scan('.', ranges=True))
+print('Re includes 2.0E6:', names(catalog.find(Re=2.0E6)))
+
+print('removing the file..')
+os.remove('out_catalog_polar.csv')
+print('rescan, files read:', catalog.scan('.', ranges=True))
+print('Re above 1.5E6:', names(catalog.find(Re=(1.5E6, None))))
+
+catalog.close()
+os.remove('out_catalog.sqlite')
+
+print('test_catalog success')
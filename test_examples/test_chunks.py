@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:05:21 2026
+
+"""
+
+from aerox import AeroX
+
+# test reading a file in blocks of rows with running statistics
+# the running values after the final block should match reading the full file
+
+print('reading polar3 in blocks of 10 rows..')
+for chunk in AeroX.iter_chunks('polar3.csv', rows=10):
+    print('rows:', chunk.x.shape[0], 'rows read so far:', chunk.x_running.count)
+    print('  block min Re:', chunk.x_min[1], ' running max Re:', chunk.x_running.max[1])
+
+print('running min max x:', chunk.x_running.min, chunk.x_running.max)
+print('running mean y:', chunk.y_running.mean)
+
+polar3 = AeroX('polar3.csv')
+print('full min max x:', polar3.x_min, polar3.x_max)
+print('full mean y:', polar3.y_mean)
+
+# constants file has a single block with no inputs
+for chunk in AeroX.iter_chunks('isa.csv'):
+    print('constants:', chunk.y_names, chunk.y_running.mean)
+
+print('test_chunks success')
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:06:21 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+import os
+import pathlib
+
+# test reading and writing files compressed with gzip, bz2 and xz
+# compression is chosen by extension when writing and found from 
+# the first bytes of the file when reading
+
+windsor = AeroX('windsor_surfacepressure_group4.csv')
+windsor.write('out_compressed.csv')
+text = open('out_compressed.csv').read()
+
+for extension in ('.gz', '.bz2', '.xz'):
+    filename = 'out_compressed.csv' + extension
+    print(f'write and read {extension}..')
+    windsor.write(filename, compresslevel=9)
+    print('smaller:', os.path.getsize(filename) < len(text))
+    data = AeroX(filename)
+    data.write('out_compressed_copy.csv')
+    print('same as uncompressed:', open('out_compressed_copy.csv').read() == text)
+    lazy = AeroX(filename, lazy=True)
+    print('lazy min max Cp:', lazy.y_min[0], lazy.y_max[0])
+    print('rows in chunks:', [chunk.y.shape[0] for chunk in AeroX.iter_chunks(filename, rows=20)])
+
+print('append rows to a compressed file..')
+polar = AeroX('polar.csv')
+polar.write_append('out_append.csv.gz')
+polar.write_append('out_append.csv.gz', start=6)
+appended = AeroX('out_append.csv.gz')
+print('rows:', appended.y.shape[0], 'last rows same:', np.array_equal(appended.y[12:], polar.y[6:]))
+
+print('compressed file without extension found from first bytes..')
+os.replace('out_compressed.csv.xz', 'out_compressed_xz')
+print('same data:', np.array_equal(AeroX('out_compressed_xz').y, windsor.y))
+
+print('paths as well as strings..')
+path = pathlib.Path('out_path.csv.gz')
+polar.write(path)
+polar.write_append(path, start=6)
+print('rows:', AeroX(path).y.shape[0])
+
+for filename in ['out_path.csv.gz', 'out_compressed_copy.csv', 'out_compressed.csv.gz', 'out_compressed.csv.bz2', 
+                 'out_compressed_xz', 'out_append.csv.gz']:
+    os.remove(filename)
+
+print('test_compressed success')
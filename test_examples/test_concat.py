@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:04:37 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+
+# test concatenating datasets split by Reynolds number
+# columns are matched by name and converted to the units of the first dataset
+
+polar = AeroX('polar.csv')
+
+print('splitting polar by Re, converting alpha to radians in the second..')
+low = AeroX('polar.csv'); low.filter_keep(Re=1.0E6)
+high = AeroX('polar.csv'); high.filter_keep(Re=2.0E6)
+high.convert_units('alpha', 'radian')
+print('units:', low.x_units, high.x_units)
+
+print('concatenating..')
+both = AeroX.concat([low, high])
+print('units:', both.x_units, 'rows:', both.y.shape[0])
+print('same as polar:', np.allclose(both.x, polar.x), np.array_equal(both.y, polar.y),
+      np.array_equal(both.id, polar.id))
+print('min max x:', both.x_min, both.x_max)
+
+print('concatenating file names..')
+twice = AeroX.concat(['polar.csv', 'polar.csv'])
+print('rows:', twice.y.shape[0], 'comments:', len(twice.comments))
+
+print('different names are an error..')
+try:
+    AeroX.concat([polar, AeroX('polar3.csv')])
+except ValueError as error:
+    print(error)
+
+twice.write('out_concat.csv')
+
+print('test_concat success')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:41:06 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+
+# test reading data as float32 and storing identifiers as codes
+# x and y are views of one table, identifiers repeat so names are stored once
+
+print('reading polar3 as float32..')
+polar3 = AeroX('polar3.csv', dtype=np.float32)
+full = AeroX('polar3.csv')
+print('dtype:', polar3.x.dtype, polar3.y.dtype, 'mean dtype:', polar3.y_mean.dtype)
+print('close to float64:', np.allclose(polar3.y, full.y, equal_nan=True))
+print('same identifiers:', np.array_equal(polar3.id, full.id))
+print('identifier names stored:', len(polar3._id_names), 'for', polar3.id.shape[0], 'rows')
+
+print('x and y share one table..')
+print('views of table:', np.shares_memory(polar3.x, polar3._table), 
+      np.shares_memory(polar3.y, polar3._table))
+
+print('replacing y is picked up when written..')
+polar = AeroX('polar.csv', dtype=np.float32)
+polar.y = 2.0*polar.y
+polar.write('out_dtype.csv')
+check = AeroX('out_dtype.csv')
+print('CL doubled:', np.allclose(check.get('CL'), 2.0*AeroX('polar.csv').get('CL')))
+
+print('insert and delete columns..')
+polar.insert_y('CDp', 'pressure drag', '-', 0.5*polar.get('CD'), after='CD')
+polar.delete('CD')
+print('y names:', polar.y_names, 'dtype:', polar.y.dtype)
+
+print('setting identifiers..')
+polar.id = np.array([['a'], ['b']]*(polar.y.shape[0]//2))
+print('identifiers:', polar.id[:4,0], 'names:', polar._id_names)
+print('same array each time:', polar.id is polar.id)
+
+print('changing identifiers in place..')
+polar.id[0,0] = 'c'
+polar.write('out_dtype.csv')
+print('identifiers written:', AeroX('out_dtype.csv').id[:4,0], 'names:', polar._id_names)
+
+print('test_dtype success')
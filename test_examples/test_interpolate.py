@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:58:14 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+
+# test interpolators are fitted when first used and refitted after the data changes
+# test interpolating selected outputs and with another method
+# test interpolate_y with arrays of inputs
+# test tiled interpolation
+
+polar = AeroX('polar.csv')
+x = np.array([[0.0,1E6], [4.0,1E6], [4.5,1.5E6]])
+
+print('adding linear interpolator..')
+polar.add_interpolator('linear')
+y = polar.interpolate(x)
+print('output y:', y)
+
+print('only CL, then nearest..')
+CL = polar.interpolate(x, outputs=['CL'])
+print('CL:', CL[:,0], 'same as all outputs:', np.allclose(CL[:,0], y[:,1]))
+print('nearest CL:', polar.interpolate(x, outputs=['CL'], interpolator='nearest')[:,0])
+
+print('CL for a range of alpha at two values of Re..')
+CL = polar.interpolate_y('CL', alpha=np.linspace(0.0, 4.0, 3), Re=[[1.0E6], [2.0E6]])
+print('CL:', CL)
+print('single value:', polar.interpolate_y('CL', alpha=4.0, Re=1.0E6))
+
+print('linear on tiles matches global linear away from tile edges..')
+polar.add_interpolator('linear', grid=False, tiles=2)
+xt = np.array([[1.0,1.2E6], [9.0,1.8E6]])
+y_tiles = polar.interpolate(xt)
+polar.add_interpolator('linear', grid=False)
+print('same:', np.allclose(y_tiles, polar.interpolate(xt)))
+polar.add_interpolator('linear')
+
+print('doubling CD refits the interpolator..')
+polar.replace('CD', 2.0*polar.get('CD'))
+print('CD doubled:', np.allclose(polar.interpolate(x)[:,0], 2.0*y[:,0]))
+
+print('keeping Re=1.0E6 refits with a single input value..')
+polar.filter_keep(Re=1.0E6)
+print('output y:', polar.interpolate(x[:2]))
+
+print('test_interpolate success')
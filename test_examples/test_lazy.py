@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:17:45 2026
+
+"""
+
+from aerox import AeroX
+import numpy as np
+
+# test opening files with lazy=True, reading only the header
+# the data is read when first used and should match reading the full file
+
+print('opening polar3 header only..')
+polar3 = AeroX('polar3.csv', lazy=True)
+print('names:', polar3.x_names, polar3.y_names, 'units:', polar3.x_units, polar3.y_units)
+print('x_nd, y_nd:', polar3.x_nd, polar3.y_nd)
+
+print('data read when first used..')
+print('min max x:', polar3.x_min, polar3.x_max)
+full = AeroX('polar3.csv')
+print('same as full read:', np.array_equal(polar3.y, full.y, equal_nan=True), 
+      polar3.comments == full.comments)
+
+print('filter a lazy object..')
+polar = AeroX('polar.csv', lazy=True)
+polar.filter_keep(Re=1.0E6)
+print('rows:', polar.y.shape[0])
+
+print('constants..')
+isa = AeroX('isa.csv', lazy=True)
+print(isa.y_names, isa.get_constant(isa.y_names[0]))
+
+print('test_lazy success')
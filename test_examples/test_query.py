@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:20:55 2026
+
+"""
+
+from aerox import AeroX, Query
+import numpy as np
+
+# test selecting rows with a Query
+# ranges, lists of values, tolerances, NaN and combinations with | and &
+
+polar3 = AeroX('polar3.csv')
+
+print('alpha between 2 and 7 at Mach 0.1 and 0.4..')
+query = Query(alpha=(2.0, 7.0), M=[0.1, 0.4])
+mask = query.mask(polar3)
+print('rows:', mask.sum(), 'alpha:', np.unique(polar3.get('alpha')[mask]))
+
+print('Re within 1000 of 1.0E6 with no relative tolerance..')
+query = Query(Re=1.0E6, rtol=0.0, atol={'Re': 1000.0})
+print('rows:', query.mask(polar3).sum())
+
+print('CM is NaN or alpha is NaN..')
+query = Query(CM=np.nan) | Query(alpha=np.nan)
+print('rows:', query.mask(polar3).sum())
+
+print('any value of CM that is not NaN and CL above 0.5..')
+query = Query(CM=(None, None)) & Query(CL=(0.5, None))
+print('rows:', query.mask(polar3).sum())
+
+print('keep alpha up to 5 and Re=2.0E6 using query and keyword..')
+polar3.filter_keep(Query(alpha=(None, 5.0)), Re=2.0E6)
+print('min max x:', polar3.x_min, polar3.x_max)
+
+print('plot CL against alpha between 0 and 7 at Re=1.0E6..')
+polar = AeroX('polar.csv')
+polar.plot('alpha', 'CL', query=Query(alpha=(0.0, 7.0)), Re=1.0E6)
+
+print('test_query success')
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:24:17 2026
+
+"""
+
+from aerox import AeroX, Catalog
+import numpy as np
+
+# test converting all columns at once to a unit system or a set of units
+# temperatures need an offset as well as a scale
+
+print('convert units.csv to SI base units, keeping alpha in degrees..')
+data = AeroX('units.csv')
+data.convert_all_units(system='SI', alpha='degrees')
+print('x_units:', data.x_units, 'y_units:', data.y_units)
+print('x max:', data.x_max)
+
+print('convert several columns in one pass..')
+data.convert_all_units({'p': 'psi', 'rho': 'slug/(ft**3)'}, v='fps')
+print('y_units:', data.y_units)
+print('y max:', data.y_max)
+
+print('same as one column at a time:')
+single = AeroX('units.csv')
+for name, unit in (('p', 'psi'), ('rho', 'slug/(ft**3)'), ('v', 'fps')):
+    single.convert_units(name, unit)
+print(np.allclose(single.y, data.y))
+
+print('temperatures..')
+tunnel = AeroX()
+tunnel.insert_x('T', 'total temperature', 'degC', np.array([0.0, 20.0, 100.0]))
+tunnel.insert_y('p0', 'total pressure', 'psi', np.array([14.5, 14.7, 15.0]))
+tunnel.convert_units('T', 'degF')
+print('T degF:', tunnel.x[:,0])
+tunnel.convert_all_units(system='SI')
+print('T, p0:', tunnel.x_units, tunnel.y_units, tunnel.x[:,0], tunnel.y[:,0])
+
+print('incompatible units change nothing..')
+try:
+    tunnel.convert_all_units(T='degC', p0='m')
+except ValueError as error:
+    print('ValueError:', error)
+print('T, p0:', tunnel.x_units, tunnel.y_units)
+
+print('check units of a catalog..')
+catalog = Catalog(':memory:')
+catalog.scan('.')
+invalid = catalog.check_units()
+print('units pint does not know:', sorted({unit for path, name, unit in invalid}))
+catalog.close()
+
+print('test_unit_systems success')
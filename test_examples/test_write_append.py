@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:46:19 2026
+
+"""
+
+from aerox import AeroX
+import filecmp
+import os
+
+# test appending rows to a file as they are acquired
+# the file should be the same as writing all rows at the end
+
+polar = AeroX('polar.csv')
+polar.write('out_write_full.csv')
+if os.path.exists('out_write_append.csv'):
+    os.remove('out_write_append.csv')
+
+print('writing Re=1.0E6 then appending Re=2.0E6 a row at a time..')
+live = AeroX('polar.csv'); live.filter_keep(Re=1.0E6)
+written = live.write_append('out_write_append.csv')
+print('rows written:', written)
+for x, y, id in zip(polar.x[6:], polar.y[6:], polar.id[6:,0]):
+    live.append_rows(x, y, id)
+    written = written + live.write_append('out_write_append.csv', start=written)
+print('rows written:', written)
+print('same as full file:', filecmp.cmp('out_write_full.csv', 'out_write_append.csv', 
+                                        shallow=False))
+
+print('different names are an error..')
+try:
+    AeroX('polar3.csv').write_append('out_write_append.csv')
+except ValueError as error:
+    print(error)
+
+print('identifiers the file does not have are an error..')
+plain = AeroX('polar.csv'); plain.id_name = []; plain.id = []
+plain.write('out_write_plain.csv')
+try:
+    polar.write_append('out_write_plain.csv')
+except ValueError as error:
+    print(error)
+
+os.remove('out_write_plain.csv')
+os.remove('out_write_full.csv')
+os.remove('out_write_append.csv')
+
+print('test_write_append success')